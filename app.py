@@ -2,7 +2,7 @@
 """
 HTTP server for Odoo MCP
 """
-import json
+
 import logging
 import os
 import sys
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 import uvicorn  # noqa: E402
 from fastapi import FastAPI, Request  # noqa: E402
-from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.responses import JSONResponse, Response  # noqa: E402
 
 from odoo_mcp.server import mcp  # FastMCP instance from our code  # noqa: E402
 
@@ -26,7 +26,12 @@ app = FastAPI(title="Odoo MCP Server")
 
 @app.post("/mcp/resource")
 async def resource_endpoint(request: Request):
-    """Endpoint for MCP resources"""
+    """
+    Endpoint for MCP resources
+
+    Resources return pre-encoded JSON, which is sent as the response body
+    unchanged, with the resource's content type.
+    """
     try:
         data = await request.json()
         resource = data.get("resource")
@@ -38,43 +43,19 @@ async def resource_endpoint(request: Request):
 
         logger.info(f"Resource request: {resource}")
 
-        # Handle resource request
-        if resource == "odoo://models":
-            result = mcp.resources["odoo://models"]()
-        elif resource.startswith("odoo://model/"):
-            model_name = resource.replace("odoo://model/", "")
-            result = mcp.resources["odoo://model/{model_name}"](model_name)
-        elif resource.startswith("odoo://record/"):
-            parts = resource.replace("odoo://record/", "").split("/")
-            if len(parts) != 2:
-                return JSONResponse(
-                    {"error": "Invalid record resource format"}, status_code=400
-                )
-            model_name, record_id = parts
-            result = mcp.resources["odoo://record/{model_name}/{record_id}"](
-                model_name, record_id
-            )
-        elif resource.startswith("odoo://search/"):
-            parts = resource.replace("odoo://search/", "").split("/")
-            if len(parts) != 2:
-                return JSONResponse(
-                    {"error": "Invalid search resource format"}, status_code=400
-                )
-            model_name, domain = parts
-            result = mcp.resources["odoo://search/{model_name}/{domain}"](
-                model_name, domain
-            )
-        else:
-            return JSONResponse(
-                {"error": f"Unknown resource: {resource}"}, status_code=400
-            )
-
-        # Parse result as JSON
         try:
-            result_json = json.loads(result)
-            return JSONResponse(result_json)
-        except (json.JSONDecodeError, TypeError, ValueError):
-            return JSONResponse({"result": result})
+            contents = list(await mcp.read_resource(resource))
+        except ValueError as e:
+            # Raised by the resource manager for URIs no resource matches
+            return JSONResponse({"error": str(e)}, status_code=400)
+
+        content = contents[0]
+        body = content.content
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return Response(
+            content=body, media_type=content.mime_type or "application/json"
+        )
 
     except Exception as e:
         logger.error(f"Error processing resource request: {str(e)}")
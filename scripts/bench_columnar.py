@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Compare the size and encode time of record and columnar result shapes.
+
+Generates search_read-like rows (scalars, dates and many2one pairs) and
+serializes them as a list of dicts, in columnar form, and in columnar form
+with flattened many2one values.
+
+Usage:
+    python scripts/bench_columnar.py [--rows 5000] [--fields 20] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from odoo_mcp import serialization  # noqa: E402
+
+
+def make_records(rows: int, fields: int) -> list[dict]:
+    records = []
+    for i in range(1, rows + 1):
+        record = {"id": i}
+        for f in range(fields):
+            kind = f % 5
+            name = f"field_{f}"
+            if kind == 0:
+                record[name] = f"Value {i}-{f}"
+            elif kind == 1:
+                record[name] = i * 1.5 + f
+            elif kind == 2:
+                record[name] = [i % 97 + 1, f"Partner {i % 97 + 1}"]
+            elif kind == 3:
+                record[name] = "2024-05-17 10:00:00" if i % 3 else False
+            else:
+                record[name] = bool(i % 2)
+        records.append(record)
+    return records
+
+
+def measure(label: str, build, repeat: int, baseline: int = 0) -> int:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = serialization.dumps(build())
+        best = min(best, time.perf_counter() - started)
+    size = len(text.encode())
+    ratio = f"{size / baseline:6.1%}" if baseline else "  100%"
+    print(f"{label:<28} {size:>12,} B {ratio}  {best * 1000:8.1f} ms")
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = make_records(args.rows, args.fields)
+    backend = "orjson" if serialization.orjson is not None else "json"
+    print(f"{args.rows} rows x {args.fields + 1} fields, backend: {backend}\n")
+
+    baseline = measure("records (list of dicts)", lambda: records, args.repeat)
+    measure(
+        "columnar",
+        lambda: serialization.to_columnar(records),
+        args.repeat,
+        baseline,
+    )
+    measure(
+        "columnar, flat many2one",
+        lambda: serialization.to_columnar(records, flatten_many2one=True),
+        args.repeat,
+        baseline,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
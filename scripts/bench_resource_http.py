@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Measure throughput of the HTTP resource endpoint on large search results.
+
+Registers a synthetic search resource returning search_read-like records
+and requests it through app.py's /mcp/resource endpoint, which passes the
+encoded JSON through, and through a copy of the former handler that
+decoded the JSON and encoded it again. No Odoo server is needed.
+
+Usage:
+    python scripts/bench_resource_http.py [--rows 5000] [--requests 200]
+        [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+from fastapi import Request  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app import app  # noqa: E402
+from odoo_mcp import serialization  # noqa: E402
+from odoo_mcp.server import mcp  # noqa: E402
+
+
+def make_records(rows: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "name": f"Partner {i}",
+            "email": f"partner{i}@example.com",
+            "parent_id": [i % 97 + 1, f"Company {i % 97 + 1}"] if i % 4 else False,
+            "credit": i * 1.25,
+            "write_date": "2024-05-17 10:00:00",
+            "active": True,
+        }
+        for i in range(1, rows + 1)
+    ]
+
+
+async def legacy_endpoint(request: Request):
+    """The former handler: decode the resource JSON and encode it again"""
+    data = await request.json()
+    contents = list(await mcp.read_resource(data["resource"]))
+    return JSONResponse(json.loads(contents[0].content))
+
+
+async def run(client: httpx.AsyncClient, path: str, total: int, workers: int):
+    remaining = total
+    received = 0
+
+    async def worker() -> None:
+        nonlocal remaining, received
+        while remaining > 0:
+            remaining -= 1
+            response = await client.post(path, json={"resource": "bench://search"})
+            response.raise_for_status()
+            received += len(response.content)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return time.perf_counter() - started, received
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    payload = serialization.dumps(make_records(args.rows))
+
+    @mcp.resource("bench://search", mime_type="application/json")
+    def bench_search() -> str:
+        return payload
+
+    app.add_api_route("/bench/legacy", legacy_endpoint, methods=["POST"])
+
+    print(f"{args.rows} records per response ({len(payload):,} B)\n")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        for label, path in [
+            ("pass-through", "/mcp/resource"),
+            ("decode + re-encode", "/bench/legacy"),
+        ]:
+            await run(c, path, args.concurrency, args.concurrency)
+            seconds, received = await run(c, path, args.requests, args.concurrency)
+            print(
+                f"{label:<20} {args.requests / seconds:8.1f} req/s "
+                f"{received / seconds / 1e6:8.1f} MB/s"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    # app.py logs every request at INFO
+    logging.disable(logging.INFO)
+    asyncio.run(main_async(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
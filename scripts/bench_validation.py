@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Compare ways of shaping employee and holiday search results.
+
+Builds name_search and hr.leave search_read rows and turns them into the
+tool response models one model per row, with a precompiled TypeAdapter for
+the whole list, and without validation (model_construct).
+
+Usage:
+    python scripts/bench_validation.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from odoo_mcp.server import (  # noqa: E402
+    EmployeeSearchResult,
+    Holiday,
+    SearchEmployeeResponse,
+    SearchHolidaysResponse,
+    _employee_results,
+    _holidays,
+)
+
+
+def make_employees(rows: int) -> list[list]:
+    return [[i, f"Employee {i}"] for i in range(1, rows + 1)]
+
+
+def make_holidays(rows: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "display_name": f"Employee {i % 500} on Paid Time Off",
+            "date_from": "2024-05-17 07:00:00",
+            "date_to": "2024-05-17 16:00:00",
+            "employee_id": [i % 500 + 1, f"Employee {i % 500}"],
+            "name": "Doctor" if i % 3 else False,
+            "state": "validate",
+        }
+        for i in range(1, rows + 1)
+    ]
+
+
+def measure(label: str, build, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<36} {best * 1000:8.1f} ms")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    employees = make_employees(args.rows)
+    holidays = make_holidays(args.rows)
+    print(f"{args.rows} rows\n")
+
+    measure(
+        "search_employee: model per row",
+        lambda: SearchEmployeeResponse(
+            success=True,
+            result=[EmployeeSearchResult(id=i, name=n) for i, n in employees],
+        ),
+        args.repeat,
+    )
+    measure(
+        "search_employee: TypeAdapter",
+        lambda: SearchEmployeeResponse(
+            success=True,
+            result=_employee_results.validate_python(
+                [{"id": i, "name": n} for i, n in employees]
+            ),
+        ),
+        args.repeat,
+    )
+    measure(
+        "search_employee: model_construct",
+        lambda: SearchEmployeeResponse.model_construct(
+            success=True,
+            result=[
+                EmployeeSearchResult.model_construct(id=i, name=n) for i, n in employees
+            ],
+        ),
+        args.repeat,
+    )
+    print()
+    measure(
+        "search_holidays: model per row",
+        lambda: SearchHolidaysResponse(
+            success=True, result=[Holiday(**row) for row in holidays]
+        ),
+        args.repeat,
+    )
+    measure(
+        "search_holidays: TypeAdapter",
+        lambda: SearchHolidaysResponse(
+            success=True, result=_holidays.validate_python(holidays)
+        ),
+        args.repeat,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
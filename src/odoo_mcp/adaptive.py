@@ -0,0 +1,105 @@
+"""
+Adaptive batch sizing for paginated and chunked reads
+
+Page and chunk sizes are learned per (model, field set) from the measured
+response time and payload size of previous calls, aiming at a target
+latency without exceeding a payload budget.
+"""
+
+import threading
+from typing import Any, Hashable, Optional
+
+
+class BatchSizer:
+    """Learns a batch size per key from observed calls"""
+
+    def __init__(
+        self,
+        target_latency: float = 1.0,
+        max_bytes: int = 8 * 1024 * 1024,
+        min_size: int = 20,
+        max_size: int = 10000,
+    ) -> None:
+        """
+        Initialize the sizer
+
+        Args:
+            target_latency: Desired duration of a single call in seconds
+            max_bytes: Maximum desired response size of a single call
+            min_size: Smallest batch size ever suggested
+            max_size: Largest batch size ever suggested
+        """
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.min_size = min_size
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._sizes: dict[Hashable, int] = {}
+        self._stats: dict[Hashable, dict[str, float]] = {}
+
+    @staticmethod
+    def key(model: str, fields: Optional[list[str]]) -> tuple:
+        """Build the key batches of a model and field selection share"""
+        return (model, tuple(sorted(fields)) if fields is not None else "*")
+
+    def size_for(self, key: Hashable, default: int) -> int:
+        """Return the learned batch size for key, or default if unknown"""
+        with self._lock:
+            return self._sizes.get(key, default)
+
+    def observe(
+        self, key: Hashable, requested: int, rows: int, seconds: float, nbytes: int
+    ) -> int:
+        """
+        Record a completed call and adjust the batch size for key
+
+        Args:
+            key: Key returned by :meth:`key`
+            requested: Batch size that was requested
+            rows: Number of rows actually returned
+            seconds: Duration of the call
+            nbytes: Size of the response payload
+
+        Returns:
+            The new batch size for key
+        """
+        with self._lock:
+            current = self._sizes.get(key, requested)
+            if rows <= 0:
+                return current
+
+            candidates = []
+            if seconds > 0:
+                candidates.append(self.target_latency * rows / seconds)
+            if nbytes > 0:
+                candidates.append(self.max_bytes * rows / nbytes)
+            if not candidates:
+                return current
+            ideal = min(candidates)
+
+            if rows < requested and ideal > current:
+                # A short page says nothing about larger batches
+                return current
+
+            # Move halfway towards the ideal size, at most doubling or halving
+            size = (current + ideal) / 2
+            size = max(current / 2, min(current * 2, size))
+            size = int(max(self.min_size, min(self.max_size, size)))
+            self._sizes[key] = size
+            self._stats[key] = {
+                "seconds_per_row": seconds / rows,
+                "bytes_per_row": nbytes / rows,
+            }
+            return size
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Learned sizes and last per-row measurements, for diagnostics"""
+        with self._lock:
+            return [
+                {
+                    "model": key[0] if isinstance(key, tuple) else key,
+                    "size": size,
+                    **self._stats.get(key, {}),
+                }
+                for key, size in self._sizes.items()
+            ]
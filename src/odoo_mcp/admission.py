@@ -0,0 +1,487 @@
+"""
+Admission control for calls made to Odoo
+
+Limits are declared per model, per method, or per model and method, and
+combine a concurrency limit with a token-bucket rate limit. On top of them,
+an adaptive limiter caps the total number of calls in flight and adjusts
+that cap to the latency Odoo shows (AIMD). Calls over a limit wait in a
+bounded queue; once the queue is full, or a call waited too long, they fail
+fast with :class:`OdooOverloadedError` instead of piling up on the Odoo
+workers.
+
+Waiting calls are dispatched by priority class (interactive, normal, bulk),
+taken from the context of the caller, while each lower class keeps a
+minimum share of the dispatches so it cannot starve.
+"""
+
+import contextvars
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+class OdooOverloadedError(Exception):
+    """Raised when a call is refused because its limits are saturated"""
+
+
+# ----- Priority classes -----
+
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BULK = "bulk"
+
+# Highest priority first
+PRIORITIES = (INTERACTIVE, NORMAL, BULK)
+
+# Minimum share of dispatches a class gets while it has calls waiting
+MIN_SHARES = {NORMAL: 0.2, BULK: 0.1}
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "odoo_priority", default=NORMAL
+)
+
+
+def current_priority() -> str:
+    """Priority class of the calling context"""
+    return _priority.get()
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Run the block, and the Odoo calls it makes, with a priority class"""
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown priority class: {name}")
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class _WaitQueue:
+    """
+    Waiting calls grouped by priority class
+
+    The head is the oldest call of the highest class, unless a lower class
+    has earned a turn: each time a class with waiting calls is passed over,
+    it is credited its minimum share, and a class holding a full credit
+    goes next.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, deque] = {name: deque() for name in PRIORITIES}
+        self._credits = {name: 0.0 for name in PRIORITIES}
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def push(self, name: str) -> tuple[str, object]:
+        ticket = (name, object())
+        self._queues[name].append(ticket)
+        return ticket
+
+    def remove(self, ticket: tuple[str, object]) -> None:
+        queue = self._queues[ticket[0]]
+        queue.remove(ticket)
+        if not queue:
+            # Credit is only earned while waiting
+            self._credits[ticket[0]] = 0.0
+
+    def head(self) -> Optional[tuple[str, object]]:
+        for name in reversed(PRIORITIES):
+            if self._queues[name] and self._credits[name] >= 1:
+                return self._queues[name][0]
+        for name in PRIORITIES:
+            if self._queues[name]:
+                return self._queues[name][0]
+        return None
+
+    def dispatch(self, ticket: tuple[str, object]) -> None:
+        """Remove an admitted head, crediting the classes passed over"""
+        name = ticket[0]
+        if self._credits[name] >= 1:
+            self._credits[name] -= 1
+        rank = PRIORITIES.index(name)
+        for other in PRIORITIES:
+            if PRIORITIES.index(other) > rank and self._queues[other]:
+                self._credits[other] += MIN_SHARES.get(other, 0)
+        self.remove(ticket)
+
+
+class _Limiter(ABC):
+    """Bounded, prioritized wait for a slot, shared by the limiters"""
+
+    def __init__(self, max_queue: int) -> None:
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        self._queue = _WaitQueue()
+        self._cond = threading.Condition()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._queue)
+
+    @abstractmethod
+    def _available(self) -> bool:
+        """Whether a call may start now; called with the lock held"""
+
+    def _admitted(self) -> None:
+        """Account for a call that starts; called with the lock held"""
+        self.in_flight += 1
+
+    def _wait_delay(self) -> Optional[float]:
+        """Seconds after which availability changes on its own, if known"""
+        return None
+
+    def _overloaded(self, reason: str) -> OdooOverloadedError:
+        self.rejected += 1
+        return OdooOverloadedError(f"Odoo is overloaded: {reason}, retry later")
+
+    def _acquire(self, deadline: float) -> None:
+        with self._cond:
+            if not self.waiting and self._available():
+                self._admitted()
+                return
+            if self.waiting >= self.max_queue:
+                raise self._overloaded(f"{self.waiting} calls already waiting")
+            ticket = self._queue.push(current_priority())
+            try:
+                while not (self._queue.head() is ticket and self._available()):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._overloaded("timed out waiting for a slot")
+                    self._cond.wait(min(remaining, self._wait_delay() or remaining))
+            except BaseException:
+                self._queue.remove(ticket)
+                # The head may have changed
+                self._cond.notify_all()
+                raise
+            self._queue.dispatch(ticket)
+            self._admitted()
+            # The next waiting call may fit as well
+            self._cond.notify_all()
+
+    def _release(self) -> None:
+        """Free a slot; called with the lock held"""
+        self.in_flight -= 1
+        self._cond.notify_all()
+
+
+def size_bucket(size: Optional[int]) -> str:
+    """
+    Coarse size class of a call, in powers of 4 of its rows or records
+
+    Examples:
+        >>> [size_bucket(n) for n in (1, 3, 4, 80, 500, None)]
+        ['0', '0', '1', '3', '4', 'all']
+    """
+    if size is None:
+        return "all"
+    return str(max(size, 1).bit_length() - 1 >> 1)
+
+
+def _rule_keys(model: str, method: str) -> list[str]:
+    """Rule keys that apply to a call, most specific last"""
+    return [model, f":{method}", f"{model}:{method}"]
+
+
+class Gate(_Limiter):
+    """Concurrency and rate limit shared by the calls matching one rule"""
+
+    def __init__(
+        self,
+        key: str,
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_queue: int = 32,
+    ) -> None:
+        """
+        Initialize the gate
+
+        Args:
+            key: Rule key, for error messages and metrics
+            concurrency: Maximum calls in flight, or None for no limit
+            rate: Calls allowed per second, or None for no limit
+            burst: Bucket size of the rate limit (defaults to max(1, rate))
+            max_queue: Maximum calls waiting for the gate
+        """
+        super().__init__(max_queue)
+        self.key = key
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst or max(1.0, rate or 0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    def _wait_delay(self) -> Optional[float]:
+        """Seconds until a token is available, or None if one is"""
+        if not self.rate or self._tokens >= 1:
+            return None
+        return (1 - self._tokens) / self.rate
+
+    def _available(self) -> bool:
+        self._refill()
+        if self.concurrency is not None and self.in_flight >= self.concurrency:
+            return False
+        return self._wait_delay() is None
+
+    def _admitted(self) -> None:
+        super()._admitted()
+        if self.rate:
+            self._tokens -= 1
+
+    def _overloaded(self, reason: str) -> OdooOverloadedError:
+        return super()._overloaded(f"{reason} for {self.key}")
+
+    def acquire(self, deadline: float) -> None:
+        """Wait for a slot and a token, or raise OdooOverloadedError"""
+        self._acquire(deadline)
+
+    def release(self) -> None:
+        with self._cond:
+            self._release()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "rate": self.rate,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "rejected": self.rejected,
+            }
+
+
+class AdaptiveLimiter(_Limiter):
+    """
+    Total concurrency limit adjusted with additive increase and
+    multiplicative decrease
+
+    A baseline latency is kept per model, method and size bucket, since a
+    page of a few hundred records is expected to be much slower than a
+    single-record lookup on the same method. While the smoothed
+    latency of completed calls stays within ``tolerance`` times that
+    baseline and calls are queuing for the limit, the limit grows by about
+    one per round trip. When latency exceeds the tolerance, or a call fails
+    with a transport error, the limit is multiplied by ``backoff``, at most
+    once per round trip.
+    """
+
+    def __init__(
+        self,
+        initial: float = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        tolerance: float = 2.0,
+        backoff: float = 0.5,
+        max_queue: int = 32,
+    ) -> None:
+        """
+        Initialize the limiter
+
+        Args:
+            initial: Starting limit
+            min_limit: Lowest limit
+            max_limit: Highest limit
+            tolerance: Latency over baseline ratio that counts as overload
+            backoff: Factor applied to the limit on overload
+            max_queue: Maximum calls waiting for the limit
+        """
+        super().__init__(max_queue)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.limit = float(max(min_limit, min(max_limit, initial)))
+        self.decreases = 0
+        self._last_decrease = 0.0
+        # model:method:size bucket -> [baseline, smoothed] latency in seconds
+        self._latency: dict[str, list[float]] = {}
+
+    def _available(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def acquire(self, deadline: float) -> float:
+        """
+        Wait until the call fits under the limit
+
+        Returns:
+            Start time to hand back to :meth:`release`
+        """
+        self._acquire(deadline)
+        return time.monotonic()
+
+    def release(self, started: float, key: str, overloaded: bool = False) -> None:
+        """
+        Record a completed call and adjust the limit
+
+        Args:
+            started: Value returned by acquire
+            key: Model, method and size bucket of the call
+            overloaded: Whether the call failed in a way that signals
+                overload (connection errors, timeouts, HTTP errors)
+        """
+        now = time.monotonic()
+        latency = now - started
+        with self._cond:
+            saturated = self.waiting or self.in_flight >= int(self.limit)
+            self._release()
+            stats = self._latency.get(key)
+            if stats is None:
+                stats = self._latency[key] = [latency, latency]
+            elif not overloaded:
+                baseline, smoothed = stats
+                # The baseline follows drops at once and rises slowly
+                stats[0] = min(latency, baseline + 0.001 * (latency - baseline))
+                stats[1] = smoothed + 0.2 * (latency - smoothed)
+
+            if overloaded or stats[1] > self.tolerance * stats[0]:
+                # Calls issued before the last decrease reflect the old limit
+                if started > self._last_decrease:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif saturated:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "rejected": self.rejected,
+                "decreases": self.decreases,
+            }
+
+
+class AdmissionController:
+    """Applies the gates matching each call and tracks calls in flight"""
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, dict[str, Any]]] = None,
+        max_queue: int = 32,
+        timeout: float = 30,
+        adaptive: Optional[AdaptiveLimiter] = None,
+    ) -> None:
+        """
+        Initialize the controller
+
+        Args:
+            limits: Mapping of rule key to {"concurrency", "rate", "burst"}.
+                Keys are a model ('account.move.line'), a method for every
+                model (':search_read') or both ('account.move.line:read_group')
+            max_queue: Maximum calls waiting per rule
+            timeout: Maximum seconds a call waits before being refused
+            adaptive: Optional limiter on the total number of calls in flight
+        """
+        self.timeout = timeout
+        self.adaptive = adaptive
+        self.gates = {
+            key: Gate(
+                key,
+                concurrency=limit.get("concurrency"),
+                rate=limit.get("rate"),
+                burst=limit.get("burst"),
+                max_queue=limit.get("max_queue", max_queue),
+            )
+            for key, limit in (limits or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, int] = {}
+        self._by_priority = {name: 0 for name in PRIORITIES}
+
+    @contextmanager
+    def admit(
+        self, model: str, method: str, size: Optional[int] = None
+    ) -> Iterator[dict[str, bool]]:
+        """
+        Hold the gates matching a call for the duration of the block
+
+        ``size`` is the number of rows or records the call works on, None
+        when unbounded; the adaptive limiter compares latencies of calls of
+        similar size only.
+
+        The block receives a dict in which it sets ``"overloaded"`` when the
+        call failed in a way that should make the adaptive limiter back off.
+        """
+        deadline = time.monotonic() + self.timeout
+        acquired: list[Gate] = []
+        name = f"{model}:{method}"
+        klass = current_priority()
+        outcome = {"overloaded": False}
+        try:
+            # Fixed order, so calls holding several gates cannot deadlock
+            for key in _rule_keys(model, method):
+                gate = self.gates.get(key)
+                if gate is not None:
+                    gate.acquire(deadline)
+                    acquired.append(gate)
+            # Taken last, so its latency samples exclude the waits above
+            started = self.adaptive.acquire(deadline) if self.adaptive else None
+            with self._lock:
+                self._in_flight[name] = self._in_flight.get(name, 0) + 1
+                self._by_priority[klass] += 1
+            try:
+                yield outcome
+            finally:
+                with self._lock:
+                    self._in_flight[name] -= 1
+                    if not self._in_flight[name]:
+                        del self._in_flight[name]
+                    self._by_priority[klass] -= 1
+                if self.adaptive:
+                    key = f"{name}:{size_bucket(size)}"
+                    self.adaptive.release(started, key, outcome["overloaded"])
+        finally:
+            for gate in reversed(acquired):
+                gate.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Calls in flight per model and method, and the state of each rule"""
+        with self._lock:
+            in_flight = dict(self._in_flight)
+            by_priority = dict(self._by_priority)
+        snapshot: dict[str, Any] = {
+            "in_flight": in_flight,
+            "in_flight_by_priority": by_priority,
+            "limits": {key: gate.snapshot() for key, gate in self.gates.items()},
+        }
+        if self.adaptive:
+            snapshot["adaptive"] = self.adaptive.snapshot()
+        return snapshot
+
+
+def parse_limits(raw: str) -> dict[str, dict[str, Any]]:
+    """
+    Parse the JSON limit configuration (ODOO_LIMITS)
+
+    Examples:
+        >>> parse_limits('{"account.move.line": {"concurrency": 2, "rate": 5}}')
+        {'account.move.line': {'concurrency': 2, 'rate': 5}}
+    """
+    if not raw.strip():
+        return {}
+    limits = json.loads(raw)
+    if not isinstance(limits, dict) or not all(
+        isinstance(limit, dict) for limit in limits.values()
+    ):
+        raise ValueError("ODOO_LIMITS must map rule keys to limit objects")
+    return limits
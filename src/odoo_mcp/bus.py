@@ -0,0 +1,202 @@
+"""
+Cache invalidation driven by Odoo bus notifications
+
+Odoo publishes bus notifications through ``/longpolling/poll`` (up to
+version 15) and through the ``/websocket`` endpoint (version 16 and later).
+The listener subscribes to configured channels and evicts the cache entries
+of the models and records named in the notifications it receives.
+
+Websocket notifications do not say which channel they were sent on, so in
+that mode a channel's model binding is looked up by the notification type;
+send notifications with the channel name as their type to use bindings.
+"""
+
+import json
+import sys
+import threading
+from typing import Any, Optional
+
+from .cache import OdooCache
+
+LONGPOLLING = "longpolling"
+WEBSOCKET = "websocket"
+
+
+def parse_channels(raw: str) -> dict[str, Optional[str]]:
+    """
+    Parse a channel configuration string
+
+    Channels are separated by commas. A channel may be bound to a model with
+    ``channel=model``, in which case notifications that do not name a model
+    evict that model.
+
+    Examples:
+        >>> parse_channels("mcp_cache, sale_updates=sale.order")
+        {'mcp_cache': None, 'sale_updates': 'sale.order'}
+    """
+    channels: dict[str, Optional[str]] = {}
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        channel, _, model = item.partition("=")
+        channels[channel.strip()] = model.strip() or None
+    return channels
+
+
+class BusListener(threading.Thread):
+    """Background thread that evicts cache entries on bus notifications"""
+
+    def __init__(
+        self,
+        client: Any,
+        cache: OdooCache,
+        channels: dict[str, Optional[str]],
+        mode: str = LONGPOLLING,
+        poll_timeout: int = 60,
+        retry_delay: float = 5,
+    ) -> None:
+        """
+        Initialize the listener
+
+        Args:
+            client: Connected OdooClient used to open a web session
+            cache: Cache to evict entries from
+            channels: Mapping of channel name to optional default model
+            mode: 'longpolling' or 'websocket'
+            poll_timeout: Seconds to wait for a long-polling response
+            retry_delay: Seconds to wait before reconnecting after an error
+        """
+        super().__init__(name="odoo-bus-listener", daemon=True)
+        if mode not in (LONGPOLLING, WEBSOCKET):
+            raise ValueError(f"Unknown bus mode: {mode}")
+        self.client = client
+        self.cache = cache
+        self.channels = channels
+        self.mode = mode
+        self.poll_timeout = poll_timeout
+        self.retry_delay = retry_delay
+        self.last = 0
+        # Set when the connection dropped, since notifications may have
+        # been missed until the next successful poll
+        self._missed = False
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """Ask the listener to stop after the current poll"""
+        self._stop_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self.mode == WEBSOCKET:
+                    self._listen_websocket()
+                else:
+                    self._listen_longpolling()
+            except Exception as e:
+                print(f"Bus listener error: {str(e)}", file=sys.stderr)
+                self._missed = True
+                self._stop_event.wait(self.retry_delay)
+
+    def _resync(self) -> None:
+        """Evict the data entries once reconnected after missing notifications"""
+        if self._missed:
+            self.cache.clear_data()
+            self._missed = False
+
+    def _listen_longpolling(self) -> None:
+        session = self.client.create_web_session()
+        url = f"{self.client.url}/longpolling/poll"
+        while not self._stop_event.is_set():
+            response = session.post(
+                url,
+                json={
+                    "jsonrpc": "2.0",
+                    "method": "call",
+                    "params": {"channels": list(self.channels), "last": self.last},
+                },
+                timeout=self.poll_timeout + self.client.timeout,
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get("error"):
+                raise ConnectionError(f"Bus poll failed: {payload['error']}")
+            self._resync()
+            for notification in payload.get("result") or []:
+                self.handle_notification(notification)
+
+    def _listen_websocket(self) -> None:
+        try:
+            import websocket
+        except ImportError:
+            raise ImportError(
+                "The websocket bus mode requires the 'websocket-client' package"
+            )
+
+        session = self.client.create_web_session()
+        url = self.client.url.replace("http", "ws", 1) + "/websocket"
+        cookie = "; ".join(f"{k}={v}" for k, v in session.cookies.items())
+        ws = websocket.create_connection(
+            url,
+            cookie=cookie,
+            origin=self.client.url,
+            timeout=self.poll_timeout,
+        )
+        try:
+            ws.send(
+                json.dumps(
+                    {
+                        "event_name": "subscribe",
+                        "data": {"channels": list(self.channels), "last": self.last},
+                    }
+                )
+            )
+            self._resync()
+            while not self._stop_event.is_set():
+                try:
+                    raw = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    continue
+                for notification in json.loads(raw) or []:
+                    self.handle_notification(notification)
+        finally:
+            ws.close()
+
+    def handle_notification(self, notification: dict[str, Any]) -> None:
+        """
+        Evict the cache entries described by a notification
+
+        The message payload may name a ``model`` and the affected ``ids``
+        (or a single ``id``/``res_id``). Without IDs the whole model is
+        evicted; without a model, the model bound to the channel is used,
+        or in websocket mode the one bound to the notification type.
+        """
+        self.last = max(self.last, notification.get("id") or 0)
+
+        channel = notification.get("channel")
+        if isinstance(channel, list):
+            # Odoo <= 14 uses [db, channel] pairs
+            channel = channel[-1]
+        message = notification.get("message")
+        if isinstance(message, dict) and "payload" in message:
+            # Odoo >= 14 wraps payloads as {"type": ..., "payload": ...}
+            if channel is None:
+                # Odoo >= 16 websocket notifications carry no channel
+                channel = message.get("type")
+            message = message["payload"]
+        if not isinstance(message, dict):
+            message = {}
+
+        model = message.get("model") or self.channels.get(channel)
+        if not model:
+            return
+
+        ids = message.get("ids")
+        if ids is None:
+            record_id = message.get("id", message.get("res_id"))
+            ids = [record_id] if record_id else None
+
+        if ids:
+            self.cache.invalidate_records(model, ids)
+        else:
+            self.cache.invalidate_model(model)
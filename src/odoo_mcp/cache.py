@@ -0,0 +1,451 @@
+"""
+Cache for Odoo schema, record and query results
+
+Entries are grouped per model so they can be evicted when Odoo reports that
+records changed (see :mod:`odoo_mcp.bus`). Storage is delegated to a
+:class:`CacheBackend`, either in-process or shared between server replicas
+through a Redis-protocol store.
+"""
+
+import heapq
+import json
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+# Bump when the layout or encoding of cached values changes
+CACHE_FORMAT_VERSION = 2
+
+# Values larger than this many bytes are compressed before being stored
+COMPRESS_THRESHOLD = 1024
+
+# Namespaces holding Odoo data, as opposed to schema entries
+DATA_PREFIXES = ("record:", "query:")
+
+# Time to live of schema entries in seconds, so fields added by a module
+# upgrade show up without restarting every replica
+SCHEMA_TTL = 3600
+
+
+def make_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-compatible parts"""
+    return json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("odoo-mcp")
+    except Exception:
+        return "0"
+
+
+def encode_value(value: Any) -> bytes:
+    """Serialize a value as compact JSON, compressing large payloads"""
+    data = json.dumps(value, separators=(",", ":"), default=str).encode()
+    if len(data) > COMPRESS_THRESHOLD:
+        return b"z" + zlib.compress(data)
+    return b"j" + data
+
+
+def decode_value(data: bytes) -> Any:
+    """Inverse of :func:`encode_value`"""
+    if data[:1] == b"z":
+        return json.loads(zlib.decompress(data[1:]))
+    return json.loads(data[1:])
+
+
+def _parent(namespace: str) -> str:
+    """Namespace up to and including its last ':'"""
+    return namespace[: namespace.rfind(":") + 1]
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cache entries
+
+    Entries are addressed by a namespace and a field inside it. Namespaces
+    can be deleted one by one or together with the other children of their
+    parent (the namespace up to its last ':'), which is how record and model
+    invalidation is implemented.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: list[tuple[str, str]]) -> list[Optional[Any]]:
+        """Return the values stored at (namespace, field) pairs, or None"""
+
+    @abstractmethod
+    def set_many(
+        self, items: list[tuple[str, str, Any]], ttl: Optional[float] = None
+    ) -> None:
+        """Store (namespace, field, value) triples, optionally expiring"""
+
+    @abstractmethod
+    def delete(self, namespaces: Iterable[str]) -> None:
+        """Delete whole namespaces"""
+
+    @abstractmethod
+    def delete_children(self, parent: str) -> None:
+        """Delete every namespace directly below parent (e.g. 'record:res.partner:')"""
+
+    @abstractmethod
+    def clear(self, prefixes: Optional[tuple[str, ...]] = None) -> None:
+        """Delete everything owned by this backend, or the namespaces
+        starting with one of prefixes"""
+
+    def get(self, namespace: str, field: str) -> Optional[Any]:
+        return self.get_many([(namespace, field)])[0]
+
+    def set(
+        self, namespace: str, field: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        self.set_many([(namespace, field, value)], ttl)
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Thread-safe in-process backend with per-entry expiry
+
+    Holds at most ``max_entries`` entries and evicts the least recently used
+    ones beyond that. Expired entries are removed as their time passes,
+    through a heap ordered by expiry, so no call scans the whole cache.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (namespace, field) -> (expires_at or None, value), least recently
+        # used first
+        self._entries: OrderedDict[tuple[str, str], tuple[Optional[float], Any]] = (
+            OrderedDict()
+        )
+        # namespace -> fields, and parent -> namespaces
+        self._namespaces: dict[str, set[str]] = {}
+        self._children: dict[str, set[str]] = {}
+        # (expires_at, namespace, field), including stale items of entries
+        # replaced or removed since
+        self._expiry: list[tuple[float, str, str]] = []
+
+    def get_many(self, keys: list[tuple[str, str]]) -> list[Optional[Any]]:
+        now = time.monotonic()
+        values: list[Optional[Any]] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    values.append(None)
+                elif entry[0] is not None and entry[0] <= now:
+                    self._remove(key)
+                    values.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    values.append(entry[1])
+        return values
+
+    def set_many(
+        self, items: list[tuple[str, str, Any]], ttl: Optional[float] = None
+    ) -> None:
+        now = time.monotonic()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._expire(now)
+            for namespace, field, value in items:
+                key = (namespace, field)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                else:
+                    self._add(namespace, field)
+                self._entries[key] = (expires_at, value)
+                if expires_at is not None:
+                    heapq.heappush(self._expiry, (expires_at, namespace, field))
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+            if len(self._expiry) > 2 * len(self._entries) + 64:
+                # Drop the stale items
+                self._expiry = [
+                    (entry[0], namespace, field)
+                    for (namespace, field), entry in self._entries.items()
+                    if entry[0] is not None
+                ]
+                heapq.heapify(self._expiry)
+
+    def _expire(self, now: float) -> None:
+        """Remove the entries whose expiry time has passed"""
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, namespace, field = heapq.heappop(self._expiry)
+            entry = self._entries.get((namespace, field))
+            if entry is not None and entry[0] == expires_at:
+                self._remove((namespace, field))
+
+    def _add(self, namespace: str, field: str) -> None:
+        fields = self._namespaces.get(namespace)
+        if fields is None:
+            fields = self._namespaces[namespace] = set()
+            self._children.setdefault(_parent(namespace), set()).add(namespace)
+        fields.add(field)
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        del self._entries[key]
+        namespace, field = key
+        fields = self._namespaces[namespace]
+        fields.discard(field)
+        if not fields:
+            del self._namespaces[namespace]
+            parent = _parent(namespace)
+            self._children[parent].discard(namespace)
+            if not self._children[parent]:
+                del self._children[parent]
+
+    def _drop(self, namespaces: Iterable[str]) -> None:
+        for namespace in namespaces:
+            for field in list(self._namespaces.get(namespace, ())):
+                self._remove((namespace, field))
+
+    def delete(self, namespaces: Iterable[str]) -> None:
+        with self._lock:
+            self._drop(namespaces)
+
+    def delete_children(self, parent: str) -> None:
+        with self._lock:
+            self._drop(list(self._children.get(parent, ())))
+
+    def clear(self, prefixes: Optional[tuple[str, ...]] = None) -> None:
+        with self._lock:
+            if prefixes is None:
+                self._entries.clear()
+                self._namespaces.clear()
+                self._children.clear()
+                self._expiry.clear()
+            else:
+                self._drop([ns for ns in self._namespaces if ns.startswith(prefixes)])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Backend shared between replicas through a Redis-protocol store
+
+    Each namespace is a hash whose values carry their own expiry time, so
+    entries with different lifetimes can share a namespace: the hash itself
+    only expires once its longest-lived entry has. Each parent keeps a set
+    of its child namespaces, so a model is evicted without scanning the
+    keyspace. Keys are prefixed with the cache format and package versions
+    so replicas running different code never read each other's entries.
+    Requires Redis 7 or later (EXPIRE NX/GT).
+    """
+
+    def __init__(self, url: str, scope: str = "") -> None:
+        """
+        Initialize the backend
+
+        Args:
+            url: Store URL (e.g., 'redis://localhost:6379/0')
+            scope: Extra key component, such as the Odoo database name
+        """
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("The redis cache backend requires the 'redis' package")
+
+        self._redis = redis.Redis.from_url(url)
+        self.prefix = f"odoo-mcp:v{CACHE_FORMAT_VERSION}:{_package_version()}:{scope}:"
+
+    def get_many(self, keys: list[tuple[str, str]]) -> list[Optional[Any]]:
+        pipe = self._redis.pipeline(transaction=False)
+        for namespace, field in keys:
+            pipe.hget(self.prefix + namespace, field)
+        now = time.time()
+        values: list[Optional[Any]] = []
+        expired = self._redis.pipeline(transaction=False)
+        for (namespace, field), data in zip(keys, pipe.execute()):
+            if data is not None:
+                expires_at, value = decode_value(data)
+                if expires_at is None or expires_at > now:
+                    values.append(value)
+                    continue
+                expired.hdel(self.prefix + namespace, field)
+            values.append(None)
+        if len(expired):
+            expired.execute()
+        return values
+
+    def set_many(
+        self, items: list[tuple[str, str, Any]], ttl: Optional[float] = None
+    ) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        keys = set()
+        pipe = self._redis.pipeline(transaction=False)
+        for namespace, field, value in items:
+            key = self.prefix + namespace
+            pipe.hset(key, field, encode_value([expires_at, value]))
+            keys.add(key)
+            parent = _parent(namespace)
+            if parent:
+                index = self._index(parent)
+                pipe.sadd(index, key)
+                keys.add(index)
+        if ttl:
+            seconds = max(1, int(ttl + 0.999))
+            for key in keys:
+                # Set a first expiry, then only ever extend it
+                pipe.expire(key, seconds, nx=True)
+                pipe.expire(key, seconds, gt=True)
+        pipe.execute()
+
+    def delete(self, namespaces: Iterable[str]) -> None:
+        keys = [self.prefix + namespace for namespace in namespaces]
+        if keys:
+            self._redis.delete(*keys)
+
+    def delete_children(self, parent: str) -> None:
+        index = self._index(parent)
+        keys = list(self._redis.smembers(index))
+        self._delete_keys(keys + [index])
+
+    def clear(self, prefixes: Optional[tuple[str, ...]] = None) -> None:
+        if prefixes is None:
+            patterns = [self.prefix]
+        else:
+            patterns = [self.prefix + p for p in prefixes]
+            patterns += [self._index(p) for p in prefixes]
+        for pattern in patterns:
+            match = self._escape(pattern) + "*"
+            self._delete_keys(list(self._redis.scan_iter(match=match, count=500)))
+
+    def _index(self, parent: str) -> str:
+        return f"{self.prefix}index:{parent}"
+
+    def _delete_keys(self, keys: list) -> None:
+        while keys:
+            self._redis.delete(*keys[:500])
+            keys = keys[500:]
+
+    @staticmethod
+    def _escape(pattern: str) -> str:
+        for char in "\\*?[]":
+            pattern = pattern.replace(char, "\\" + char)
+        return pattern
+
+
+class OdooCache:
+    """Schema, record and query cache on top of a backend"""
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        backend: Optional[CacheBackend] = None,
+        schema_ttl: float = SCHEMA_TTL,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Time to live of record and query entries in seconds
+            backend: Storage backend (in-process by default)
+            schema_ttl: Time to live of fields_get entries in seconds
+        """
+        self.ttl = ttl
+        self.backend = backend or MemoryBackend()
+        self.schema_ttl = schema_ttl
+
+    def get_fields(self, model: str) -> Optional[dict[str, Any]]:
+        """Return cached ``fields_get`` output for a model, if any"""
+        return self.backend.get(f"schema:{model}", "fields")
+
+    def set_fields(self, model: str, fields: dict[str, Any]) -> None:
+        """Store ``fields_get`` output for a model"""
+        self.backend.set(f"schema:{model}", "fields", fields, self.schema_ttl)
+
+    def get_records(
+        self, model: str, ids: Iterable[int], fields_key: str
+    ) -> tuple[dict[int, Any], list[int]]:
+        """
+        Look up records by ID
+
+        Returns:
+            Tuple of (records found by ID, IDs that must be read from Odoo)
+        """
+        ids = list(ids)
+        values = self.backend.get_many(
+            [(f"record:{model}:{record_id}", fields_key) for record_id in ids]
+        )
+        found: dict[int, Any] = {}
+        missing: list[int] = []
+        for record_id, value in zip(ids, values):
+            if value is None:
+                missing.append(record_id)
+            else:
+                found[record_id] = value
+        return found, missing
+
+    def set_records(self, model: str, records: Iterable[dict], fields_key: str) -> None:
+        """Store records read with the given field selection"""
+        self.backend.set_many(
+            [
+                (f"record:{model}:{record['id']}", fields_key, record)
+                for record in records
+                if "id" in record
+            ],
+            self.ttl,
+        )
+
+    def get_query(self, model: str, key: str) -> Optional[Any]:
+        """Return a cached query result, if still fresh"""
+        return self.backend.get(f"query:{model}", key)
+
+    def set_query(
+        self, model: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store a query result, optionally with a shorter time to live"""
+        self.backend.set(f"query:{model}", key, value, ttl or self.ttl)
+
+    def invalidate_model(self, model: str) -> None:
+        """Evict every record and query entry of a model"""
+        self.backend.delete_children(f"record:{model}:")
+        self.backend.delete([f"query:{model}"])
+
+    def invalidate_records(self, model: str, ids: Iterable[int]) -> None:
+        """Evict specific records and every query entry of their model"""
+        self.backend.delete(
+            [f"record:{model}:{record_id}" for record_id in ids] + [f"query:{model}"]
+        )
+
+    def clear(self) -> None:
+        """Evict everything, including schema entries"""
+        self.backend.clear()
+
+    def clear_data(self) -> None:
+        """Evict every record and query entry, keeping schema entries"""
+        self.backend.clear(DATA_PREFIXES)
+
+
+def create_cache(
+    ttl: float,
+    backend: str = "memory",
+    url: Optional[str] = None,
+    scope: str = "",
+    max_entries: int = 100_000,
+) -> OdooCache:
+    """
+    Create a cache with the configured backend
+
+    Args:
+        ttl: Time to live of record and query entries in seconds
+        backend: 'memory' or 'redis'
+        url: Store URL, required by the redis backend
+        scope: Key scope for shared backends, such as the database name
+        max_entries: Size bound of the memory backend
+    """
+    if backend == "memory":
+        return OdooCache(ttl=ttl, backend=MemoryBackend(max_entries=max_entries))
+    if backend == "redis":
+        if not url:
+            raise ValueError("The redis cache backend requires ODOO_CACHE_URL")
+        return OdooCache(ttl=ttl, backend=RedisBackend(url, scope=scope))
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,231 @@
+"""
+Streaming export of Odoo records to local files
+
+Records are paged from Odoo with keyset pagination and written as they
+arrive, so memory use stays flat regardless of the number of rows.
+"""
+
+import csv
+import os
+import re
+import tempfile
+import time
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from . import serialization
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+
+def get_export_dir() -> str:
+    """Directory export files are written to (ODOO_EXPORT_DIR)"""
+    export_dir = os.environ.get("ODOO_EXPORT_DIR") or os.path.join(
+        tempfile.gettempdir(), "odoo-mcp-exports"
+    )
+    os.makedirs(export_dir, exist_ok=True)
+    return export_dir
+
+
+def resolve_export_path(model: str, fmt: str, filename: Optional[str] = None) -> str:
+    """
+    Build the output path inside the export directory
+
+    Only the base name of a caller-provided filename is used, so exports
+    cannot be written outside of the export directory.
+    """
+    if filename:
+        name = os.path.basename(filename)
+    else:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{re.sub(r'[^A-Za-z0-9_]', '_', model)}-{stamp}.{fmt}"
+    if not name or name.startswith("."):
+        raise ValueError(f"Invalid export filename: {filename}")
+    return os.path.join(get_export_dir(), name)
+
+
+def _cell(value: Any) -> Any:
+    """Flatten a record value for tabular formats"""
+    if isinstance(value, (list, dict)):
+        return serialization.dumps(value, pretty=False)
+    return value
+
+
+def _write_ndjson(path: str, records: Iterable[dict]) -> int:
+    rows = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            # One record per line, whatever ODOO_JSON_PRETTY says
+            f.write(serialization.dumps(record, pretty=False))
+            f.write("\n")
+            rows += 1
+    return rows
+
+
+def _write_csv(path: str, records: Iterator[dict], fields: Optional[list]) -> int:
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = None
+        for record in records:
+            if writer is None:
+                columns = ["id"] + [name for name in fields or record if name != "id"]
+                writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+                writer.writeheader()
+            writer.writerow({key: _cell(value) for key, value in record.items()})
+            rows += 1
+    return rows
+
+
+# Arrow types for Odoo field types; anything else is written as JSON text
+_ARROW_TYPES = {
+    "integer": "int64",
+    "float": "float64",
+    "monetary": "float64",
+    "boolean": "bool_",
+}
+
+
+def _write_parquet(
+    path: str,
+    records: Iterator[dict],
+    fields: Optional[list],
+    field_types: dict[str, str],
+    batch_size: int,
+) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("The parquet export format requires the 'pyarrow' package")
+
+    rows = 0
+    writer = None
+    columns: list[str] = []
+    schema = None
+    batch: list[dict] = []
+
+    def arrow_type(name: str) -> str:
+        return _ARROW_TYPES.get(field_types.get(name, ""), "string")
+
+    def flush() -> None:
+        data = {}
+        for name in columns:
+            kind = arrow_type(name)
+            values = []
+            for record in batch:
+                value = record.get(name)
+                if value is False and kind != "bool_":
+                    # Odoo returns False for empty non-boolean fields
+                    value = None
+                elif kind == "string" and value is not None:
+                    value = value if isinstance(value, str) else _cell(value)
+                values.append(value)
+            data[name] = values
+        writer.write_table(pa.table(data, schema=schema))
+        batch.clear()
+
+    for record in records:
+        if writer is None:
+            columns = ["id"] + [name for name in fields or record if name != "id"]
+            schema = pa.schema(
+                [(name, getattr(pa, arrow_type(name))()) for name in columns]
+            )
+            writer = pq.ParquetWriter(path, schema)
+        batch.append(record)
+        rows += 1
+        if len(batch) >= batch_size:
+            flush()
+
+    if writer is None:
+        # No rows: still produce a valid, empty file
+        pq.write_table(pa.table({"id": pa.array([], pa.int64())}), path)
+        return 0
+    if batch:
+        flush()
+    writer.close()
+    return rows
+
+
+def export_records(
+    client: Any,
+    model: str,
+    domain: list,
+    fields: Union[list[str], str, None] = None,
+    fmt: str = "ndjson",
+    filename: Optional[str] = None,
+    page_size: Optional[int] = None,
+    parallelism: int = 1,
+) -> dict[str, Any]:
+    """
+    Stream matching records to a file in the export directory
+
+    Args:
+        client: Connected OdooClient
+        model: Name of the model (e.g., 'account.move.line')
+        domain: Normalized search domain
+        fields: Field names to export, None for the default projection or
+            '*' for all fields
+        fmt: 'ndjson', 'csv' or 'parquet'
+        filename: Optional file name inside the export directory
+        page_size: Records fetched per search_read call (learned when omitted)
+        parallelism: Number of id-range shards fetched concurrently
+
+    Returns:
+        Dictionary with the file path, row count, byte size and timings
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Use one of {FORMATS}")
+
+    path = resolve_export_path(model, fmt, filename)
+    # Without an explicit list, columns follow the keys of the first record
+    columns = fields if isinstance(fields, list) else None
+    started = time.perf_counter()
+    fetch_seconds = 0.0
+
+    def timed_records() -> Iterator[dict]:
+        nonlocal fetch_seconds
+        if parallelism > 1:
+            records = client.scan(
+                model, domain, fields, parallelism=parallelism, page_size=page_size
+            )
+        else:
+            records = client.iter_search_read(
+                model, domain, fields, page_size=page_size
+            )
+        while True:
+            tick = time.perf_counter()
+            try:
+                record = next(records)
+            except StopIteration:
+                return
+            finally:
+                fetch_seconds += time.perf_counter() - tick
+            yield record
+
+    if fmt == "ndjson":
+        rows = _write_ndjson(path, timed_records())
+    elif fmt == "csv":
+        rows = _write_csv(path, timed_records(), columns)
+    else:
+        model_fields = client.get_model_fields(model)
+        field_types = {
+            name: meta.get("type", "")
+            for name, meta in model_fields.items()
+            if isinstance(meta, dict)
+        }
+        field_types["id"] = "integer"
+        rows = _write_parquet(
+            path, timed_records(), columns, field_types, page_size or 1000
+        )
+
+    total_seconds = time.perf_counter() - started
+    return {
+        "path": path,
+        "format": fmt,
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+        "timings": {
+            "fetch_seconds": round(fetch_seconds, 3),
+            "write_seconds": round(total_seconds - fetch_seconds, 3),
+            "total_seconds": round(total_seconds, 3),
+        },
+    }
@@ -2,13 +2,19 @@
 Odoo XML-RPC client for MCP server integration
 """
 
+import contextvars
 import http.client
 import json
 import os
+import queue
 import re
 import socket
+import threading
+import time
 import urllib.parse
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
 
 # Security: Patch xmlrpc.client to prevent XML attacks (B411)
 from defusedxml import xmlrpc as defused_xmlrpc
@@ -18,6 +24,199 @@ defused_xmlrpc.monkey_patch()
 # Now safe to import xmlrpc.client after monkey-patching
 import xmlrpc.client  # noqa: E402, S411
 
+from .adaptive import BatchSizer  # noqa: E402
+from .admission import (  # noqa: E402
+    AdaptiveLimiter,
+    AdmissionController,
+    parse_limits,
+)
+from .cache import OdooCache, create_cache, make_key  # noqa: E402
+
+
+def chunked(items: list, size: int) -> list[list]:
+    """Split a list into consecutive chunks of at most size items"""
+    chunks = []
+    for start in range(0, len(items), size):
+        end = start + size
+        chunks.append(items[start:end])
+    return chunks
+
+
+def _relational_ids(value: Any) -> list[int]:
+    """IDs held by a many2one ([id, name] or id) or x2many (ids) value"""
+    if not value:
+        return []
+    if isinstance(value, int):
+        return [value]
+    if len(value) == 2 and isinstance(value[1], str):
+        return [value[0]]
+    return [item for item in value if isinstance(item, int)]
+
+
+# Field types left out of the default projection: large or costly to read
+HEAVY_FIELD_TYPES = ("binary", "html", "one2many", "many2many")
+
+# Pass as ``fields`` to read every field of a model
+ALL_FIELDS = "*"
+
+# Page size used before the batch sizer has learned one
+DEFAULT_PAGE_SIZE = 1000
+
+# Odoo's default ``load``: many2one values are read as [id, display_name]
+CLASSIC_READ = "_classic_read"
+
+# Methods that never change records; any other method called through
+# execute_method evicts the cache entries of its model
+READ_ONLY_METHODS = frozenset(
+    {
+        "read",
+        "search",
+        "search_read",
+        "search_count",
+        "read_group",
+        "fields_get",
+        "name_search",
+        "name_get",
+        "default_get",
+        "check_access_rights",
+    }
+)
+
+
+def _touched_ids(method: str, args: tuple) -> Optional[list[int]]:
+    """IDs a mutating call works on, [] for create, None when unknown"""
+    if method == "create":
+        return []
+    target = args[0] if args else None
+    if isinstance(target, int) and not isinstance(target, bool):
+        return [target]
+    if isinstance(target, list) and all(
+        isinstance(i, int) and not isinstance(i, bool) for i in target
+    ):
+        return target
+    return None
+
+
+def _set_load(kwargs: dict, load: Optional[str]) -> None:
+    """Pass Odoo's ``load`` option when it differs from the default"""
+    if load != CLASSIC_READ:
+        # None cannot be marshalled; any value but '_classic_read' means raw ids
+        kwargs["load"] = load or False
+
+
+def _with_expanded_fields(fields: list[str], expand: Optional[dict]) -> list[str]:
+    """Make sure the fields being expanded are read"""
+    if not expand:
+        return fields
+    return list(fields) + [name for name in expand if name not in fields]
+
+
+# Position of the limit among the positional arguments of search methods
+_LIMIT_POSITIONS = {"search": 2, "search_read": 3}
+# Methods whose first argument is a domain and whose cost has no row bound
+_DOMAIN_METHODS = {"search_count", "read_group"}
+
+
+def _call_size(method: str, args: tuple, kwargs: dict) -> Optional[int]:
+    """Rows or records a call works on, None when it is unbounded"""
+    if method in _LIMIT_POSITIONS:
+        position = _LIMIT_POSITIONS[method]
+        limit = args[position] if len(args) > position else None
+        return kwargs.get("limit", limit) or None
+    if method in _DOMAIN_METHODS:
+        return None
+    if args and isinstance(args[0], (list, tuple)):
+        # IDs, or the values of a batch create
+        return len(args[0])
+    return 1
+
+
+class OdooBatchError(Exception):
+    """
+    Raised when some chunks of a chunked operation fail
+
+    The message ends with the error of the first failed chunk, so a single
+    failing call still reports what Odoo answered.
+
+    Attributes:
+        results: Merged results of the chunks that succeeded, in input order
+        failures: One entry per failed chunk with its index, input and error
+    """
+
+    def __init__(self, message: str, results: list, failures: list[dict]) -> None:
+        if failures:
+            message = f"{message}: {failures[0]['error']}"
+        super().__init__(message)
+        self.results = results
+        self.failures = failures
+
+
+class ProxyPool:
+    """
+    XML-RPC proxies checked out by one caller at a time
+
+    A ServerProxy and its transport hold a single HTTP connection and are
+    not thread-safe. Every call checks a proxy out, so concurrent callers
+    never share one, and idle proxies are reused by any thread, keeping
+    their connections alive across short-lived threads.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_idle: int = 32) -> None:
+        """
+        Initialize the pool
+
+        Args:
+            factory: Creates a new proxy
+            max_idle: Maximum number of idle proxies kept open
+        """
+        self._factory = factory
+        self.max_idle = max_idle
+        self.in_use = 0
+        self.created = 0
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """Lend a proxy for the duration of the block"""
+        with self._lock:
+            proxy = self._idle.pop() if self._idle else None
+            self.in_use += 1
+        if proxy is None:
+            try:
+                proxy = self._factory()
+            except BaseException:
+                with self._lock:
+                    self.in_use -= 1
+                raise
+            with self._lock:
+                self.created += 1
+
+        reusable = False
+        try:
+            yield proxy
+            reusable = True
+        except xmlrpc.client.Fault:
+            # Odoo answered, so the connection is still usable
+            reusable = True
+            raise
+        finally:
+            with self._lock:
+                self.in_use -= 1
+                if reusable and len(self._idle) < self.max_idle:
+                    self._idle.append(proxy)
+                    proxy = None
+            if proxy is not None:
+                proxy("close")()
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "in_use": self.in_use,
+                "idle": len(self._idle),
+                "created": self.created,
+            }
+
 
 class OdooClient:
     """Client for interacting with Odoo via XML-RPC"""
@@ -30,6 +229,13 @@ class OdooClient:
         password: str,
         timeout: int = 10,
         verify_ssl: bool = True,
+        cache: Optional[OdooCache] = None,
+        max_workers: int = 4,
+        read_chunk_size: int = 1000,
+        write_chunk_size: int = 100,
+        batch_sizer: Optional[BatchSizer] = None,
+        count_ttl: float = 30,
+        admission: Optional[AdmissionController] = None,
     ) -> None:
         """
         Initialize the Odoo client with connection parameters
@@ -41,6 +247,13 @@ class OdooClient:
             password: Login password
             timeout: Connection timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            cache: Optional cache for schema, record and query results
+            max_workers: Number of concurrent XML-RPC calls for chunked operations
+            read_chunk_size: Maximum number of IDs sent in a single read call
+            write_chunk_size: Maximum number of records per bulk create/write call
+            batch_sizer: Learns page and chunk sizes when callers leave them unset
+            count_ttl: Time to live of cached counts and existence checks
+            admission: Limits applied to every call (none by default)
         """
         # Ensure URL has a protocol
         if not re.match(r"^https?://", url):
@@ -58,10 +271,23 @@ class OdooClient:
         # Set timeout and SSL verification
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-
-        # Setup connections
+        self.cache = cache
+        self.max_workers = max_workers
+        self.read_chunk_size = read_chunk_size
+        self.write_chunk_size = write_chunk_size
+        self.batch_sizer = batch_sizer or BatchSizer()
+        self.count_ttl = count_ttl
+        self.admission = admission or AdmissionController()
+        self._default_fields: dict[str, Optional[list[str]]] = {}
+        self._field_types: dict[str, dict[str, str]] = {}
+
+        # Setup connections. ServerProxy objects are not thread-safe, so each
+        # call checks an object endpoint proxy out of a pool (see _execute).
         self._common = None
-        self._models = None
+        self.proxy_pool = ProxyPool(lambda: self._create_proxy("object"))
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         # Parse hostname for logging
         parsed_url = urllib.parse.urlparse(self.url)
@@ -70,23 +296,23 @@ class OdooClient:
         # Connect
         self._connect()
 
-    def _connect(self):
-        """Initialize the XML-RPC connection and authenticate"""
+    def _create_proxy(self, endpoint: str) -> xmlrpc.client.ServerProxy:
+        """Create a ServerProxy with its own transport for an XML-RPC endpoint"""
         # Create transport with appropriate timeout
         is_https = self.url.startswith("https://")
         transport = RedirectTransport(
             timeout=self.timeout, use_https=is_https, verify_ssl=self.verify_ssl
         )
+        return xmlrpc.client.ServerProxy(
+            f"{self.url}/xmlrpc/2/{endpoint}", transport=transport
+        )
 
+    def _connect(self):
+        """Initialize the XML-RPC connection and authenticate"""
         print(f"Connecting to Odoo at: {self.url}", file=os.sys.stderr)
 
         # Setup endpoints
-        self._common = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/common", transport=transport
-        )
-        self._models = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/object", transport=transport
-        )
+        self._common = self._create_proxy("common")
 
         # Authenticate and get user ID
         print(f"Authenticating with database: {self.db}", file=os.sys.stderr)
@@ -104,16 +330,182 @@ class OdooClient:
             print(f"Authentication error: {str(e)}", file=os.sys.stderr)
             raise ValueError(f"Failed to authenticate with Odoo: {str(e)}")
 
+    def create_web_session(self):
+        """
+        Open an authenticated HTTP session on the Odoo web controllers
+
+        Used by features that are not available over XML-RPC, such as the
+        bus. Note that API keys are not accepted for web logins.
+
+        Returns:
+            requests.Session carrying the Odoo session cookie
+        """
+        import requests
+
+        session = requests.Session()
+        session.verify = self.verify_ssl
+        response = session.post(
+            f"{self.url}/web/session/authenticate",
+            json={
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {
+                    "db": self.db,
+                    "login": self.username,
+                    "password": self.password,
+                },
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("error") or not (payload.get("result") or {}).get("uid"):
+            raise ValueError("Failed to open an Odoo web session")
+        return session
+
     def _execute(self, model: str, method: str, *args, **kwargs) -> Any:
-        """Execute a method on an Odoo model"""
-        return self._models.execute_kw(
-            self.db, self.uid, self.password, model, method, args, kwargs
+        """
+        Execute a method on an Odoo model
+
+        Raises:
+            OdooOverloadedError: If admission control refuses the call
+        """
+        size = _call_size(method, args, kwargs)
+        with (
+            self.admission.admit(model, method, size) as outcome,
+            self.proxy_pool.checkout() as models,
+        ):
+            started = time.perf_counter()
+            try:
+                return models.execute_kw(
+                    self.db, self.uid, self.password, model, method, args, kwargs
+                )
+            except xmlrpc.client.Fault:
+                # Raised by Odoo itself: the server answered
+                raise
+            except (OSError, xmlrpc.client.ProtocolError):
+                outcome["overloaded"] = True
+                raise
+            finally:
+                # Excludes admission waits, for the batch sizer
+                self._local.last_call_seconds = time.perf_counter() - started
+                transport = models("transport")
+                self._local.last_response_size = transport.last_response_size
+
+    def _execute_measured(
+        self, sizer_key: tuple, requested: int, model: str, method: str, *args, **kwargs
+    ) -> Any:
+        """Execute a batched read and feed its latency and size to the sizer"""
+        result = self._execute(model, method, *args, **kwargs)
+        self.batch_sizer.observe(
+            sizer_key,
+            requested,
+            len(result),
+            self._local.last_call_seconds,
+            self._local.last_response_size,
+        )
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="odoo-rpc"
+                )
+            return self._executor
+
+    def _run_in_worker(self, fn: Callable, *args: Any) -> Any:
+        # Nested fan-outs run inline so they cannot exhaust the pool
+        self._local.in_worker = True
+        return fn(*args)
+
+    def _in_worker(self) -> bool:
+        return getattr(self._local, "in_worker", False)
+
+    def _submit(self, fn: Callable, *args: Any) -> Future:
+        """Run fn on the worker pool with the caller's context variables"""
+        return self._get_executor().submit(
+            contextvars.copy_context().run, self._run_in_worker, fn, *args
         )
 
+    def _run_parallel(self, fn: Callable, items: list) -> list[tuple[Any, Any]]:
+        """
+        Call fn on each item over the worker pool
+
+        Returns:
+            List of (result, error) pairs in input order, where exactly one
+            of the two is None
+        """
+        if len(items) <= 1 or self._in_worker():
+            outcomes = []
+            for item in items:
+                try:
+                    outcomes.append((fn(item), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+            return outcomes
+
+        futures = [self._submit(fn, item) for item in items]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append((future.result(), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+
+    def _read_chunked(
+        self, model_name: str, ids: list, kwargs: dict, chunk_size: Optional[int]
+    ) -> list:
+        """
+        Read IDs in concurrent chunks, raising OdooBatchError on failures
+
+        Without an explicit chunk_size, the size learned by the batch sizer
+        is used and refined with every chunk.
+        """
+        sizer_key = None
+        if chunk_size is None:
+            sizer_key = BatchSizer.key(model_name, kwargs.get("fields"))
+            chunk_size = self.batch_sizer.size_for(sizer_key, self.read_chunk_size)
+
+        def read_chunk(chunk: list) -> list:
+            # Options go as keywords: a positional dict would be read by
+            # Odoo as the field list
+            if sizer_key is None:
+                return self._execute(model_name, "read", chunk, **kwargs)
+            return self._execute_measured(
+                sizer_key, len(chunk), model_name, "read", chunk, **kwargs
+            )
+
+        chunks = chunked(ids, chunk_size)
+        outcomes = self._run_parallel(read_chunk, chunks)
+
+        records: list = []
+        failures: list[dict] = []
+        for index, (chunk, (result, error)) in enumerate(zip(chunks, outcomes)):
+            if error is None:
+                records.extend(result)
+            else:
+                failures.append({"chunk": index, "ids": chunk, "error": str(error)})
+
+        if failures:
+            raise OdooBatchError(
+                f"{len(failures)} of {len(chunks)} read chunks failed on "
+                f"{model_name}",
+                results=records,
+                failures=failures,
+            )
+        return records
+
     def execute_method(self, model: str, method: str, *args, **kwargs) -> Any:
         """
         Execute an arbitrary method on a model
 
+        Unless the method is known to be read-only, the cached records it
+        was called on and the cached queries and counts of the model are
+        evicted once it succeeds; the whole model is evicted when the call
+        does not name its records. Other models it changes are not.
+
         Args:
             model: The model name (e.g., 'res.partner')
             method: Method name to execute
@@ -123,7 +515,14 @@ class OdooClient:
         Returns:
             Result of the method execution
         """
-        return self._execute(model, method, *args, **kwargs)
+        result = self._execute(model, method, *args, **kwargs)
+        if self.cache is not None and method not in READ_ONLY_METHODS:
+            ids = _touched_ids(method, args)
+            if ids is None:
+                self.cache.invalidate_model(model)
+            else:
+                self.cache.invalidate_records(model, ids)
+        return result
 
     def get_models(self) -> list[str]:
         """
@@ -218,14 +617,71 @@ class OdooClient:
             Dictionary of field definitions
         """
         try:
+            if self.cache is not None:
+                cached = self.cache.get_fields(model_name)
+                if cached is not None:
+                    return cached
             fields = self._execute(model_name, "fields_get")
+            if self.cache is not None:
+                self.cache.set_fields(model_name, fields)
             return fields
         except Exception as e:
             print(f"Error retrieving fields: {str(e)}", file=os.sys.stderr)
             return {"error": str(e)}
 
+    def default_fields(self, model_name: str) -> Optional[list[str]]:
+        """
+        Fields read when the caller does not name any
+
+        Keeps stored scalar and many2one fields, and leaves out binary, HTML
+        and x2many fields as well as non-stored computed fields. The
+        projection is derived from fields_get once per model.
+
+        Returns:
+            List of field names, or None (all fields) if fields_get fails
+        """
+        if model_name not in self._default_fields:
+            model_fields = self.get_model_fields(model_name)
+            if "error" in model_fields:
+                return None
+            self._default_fields[model_name] = [
+                name
+                for name, meta in model_fields.items()
+                if meta.get("store", True) and meta.get("type") not in HEAVY_FIELD_TYPES
+            ]
+        return self._default_fields[model_name]
+
+    def field_types(self, model_name: str) -> dict[str, str]:
+        """Odoo type of each field of a model, derived once from fields_get"""
+        if model_name not in self._field_types:
+            model_fields = self.get_model_fields(model_name)
+            if "error" in model_fields:
+                return {}
+            self._field_types[model_name] = {
+                name: meta.get("type", "")
+                for name, meta in model_fields.items()
+                if isinstance(meta, dict)
+            }
+        return self._field_types[model_name]
+
+    def _resolve_fields(self, model_name: str, fields: Any) -> Optional[list[str]]:
+        """Map None to the default projection and '*' to all fields"""
+        if fields == ALL_FIELDS:
+            return None
+        if fields is None:
+            return self.default_fields(model_name)
+        return fields
+
     def search_read(
-        self, model_name, domain, fields=None, offset=None, limit=None, order=None
+        self,
+        model_name,
+        domain,
+        fields=None,
+        offset=None,
+        limit=None,
+        order=None,
+        expand=None,
+        load=CLASSIC_READ,
     ):
         """
         Search for records and read their data in a single call
@@ -233,74 +689,733 @@ class OdooClient:
         Args:
             model_name: Name of the model (e.g., 'res.partner')
             domain: Search domain (e.g., [('is_company', '=', True)])
-            fields: List of field names to return (None for all)
+            fields: List of field names to return, None for the default
+                projection (see default_fields) or '*' for all fields
             offset: Number of records to skip
             limit: Maximum number of records to return
             order: Sorting criteria (e.g., 'name ASC, id DESC')
+            expand: Relational fields to replace by their records
+                (see expand_records)
+            load: None to read many2one values as plain IDs, which spares
+                Odoo computing display names (see resolve_display_names)
 
         Returns:
             List of dictionaries with the matching records
 
+        Raises:
+            OdooOverloadedError: If admission control refuses the call
+            xmlrpc.client.Fault: If Odoo rejects the search
+
         Examples:
             >>> client = OdooClient(url, db, username, password)
             >>> records = client.search_read('res.partner', [('is_company', '=', True)], limit=5)
             >>> print(len(records))
             5
         """
-        try:
-            # Odoo XML-RPC signature:
-            # execute_kw(db, uid, password, model, 'search_read', [domain], {kwargs})
-            # Domain must be a list, even if empty
-            kwargs = {}
-            if fields is not None:
-                kwargs["fields"] = fields
-            if offset is not None:
-                kwargs["offset"] = offset
-            if limit is not None:
-                kwargs["limit"] = limit
-            if order is not None:
-                kwargs["order"] = order
-
+        # Odoo XML-RPC signature:
+        # execute_kw(db, uid, password, model, 'search_read', [domain], {kwargs})
+        # Domain must be a list, even if empty
+        kwargs = {}
+        fields = self._resolve_fields(model_name, fields)
+        if fields is not None:
+            kwargs["fields"] = _with_expanded_fields(fields, expand)
+        if offset is not None:
+            kwargs["offset"] = offset
+        if limit is not None:
+            kwargs["limit"] = limit
+        if order is not None:
+            kwargs["order"] = order
+        _set_load(kwargs, load)
+
+        result = None
+        if self.cache is not None:
+            key = make_key(domain, kwargs)
+            result = self.cache.get_query(model_name, key)
+
+        if result is None:
             # Pass domain as single positional arg, rest as kwargs
             result = self._execute(model_name, "search_read", domain, **kwargs)
+            if self.cache is not None:
+                self.cache.set_query(model_name, key, result)
+
+        if expand:
+            result = self.expand_records(model_name, result, expand)
+        return result
+
+    def _count_many(self, model_name: str, domains: list[list], kind: str) -> list:
+        """Run one cached search_count or existence search per domain"""
+
+        def run(domain: list) -> Any:
+            key = make_key(kind, domain)
+            if self.cache is not None:
+                cached = self.cache.get_query(model_name, key)
+                if cached is not None:
+                    return cached
+            if kind == "count":
+                result = self._execute(model_name, "search_count", domain)
+            else:
+                result = bool(self._execute(model_name, "search", domain, limit=1))
+            if self.cache is not None:
+                self.cache.set_query(model_name, key, result, self.count_ttl)
             return result
-        except Exception as e:
-            print(f"Error in search_read: {str(e)}", file=os.sys.stderr)
-            return []
 
-    def read_records(self, model_name, ids, fields=None):
+        outcomes = self._run_parallel(run, list(domains))
+        results = [result for result, _error in outcomes]
+        failures = [
+            {"index": index, "domain": domain, "error": str(error)}
+            for index, (domain, (_result, error)) in enumerate(zip(domains, outcomes))
+            if error is not None
+        ]
+        if failures:
+            raise OdooBatchError(
+                f"{len(failures)} of {len(domains)} {kind} queries failed on "
+                f"{model_name}",
+                results=results,
+                failures=failures,
+            )
+        return results
+
+    def count_records(self, model_name: str, domains: list[list]) -> list[int]:
+        """
+        Count the records matching each domain without reading them
+
+        One search_count call is made per domain, concurrently. Results are
+        cached for count_ttl seconds when the cache is enabled.
+
+        Args:
+            model_name: Name of the model (e.g., 'account.move')
+            domains: Search domains, one count per domain
+
+        Returns:
+            Counts in the order of the domains
+
+        Raises:
+            OdooBatchError: If some counts fail; results holds None for them
+        """
+        return self._count_many(model_name, domains, "count")
+
+    def exists(self, model_name: str, domains: list[list]) -> list[bool]:
+        """
+        Check whether any record matches each domain
+
+        Uses search with limit=1, which lets the database stop at the first
+        match. Cached like count_records.
+
+        Returns:
+            One boolean per domain, in order
+
+        Raises:
+            OdooBatchError: If some checks fail; results holds None for them
+        """
+        return self._count_many(model_name, domains, "exists")
+
+    def read_group(
+        self,
+        model_name: str,
+        domain: list,
+        aggregates: list[str],
+        groupby: list[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        orderby: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Aggregate records on the Odoo server, grouped by one or more fields
+
+        Args:
+            model_name: Name of the model (e.g., 'sale.order')
+            domain: Search domain (e.g., [('state', '=', 'sale')])
+            aggregates: Aggregate specs such as 'amount_total:sum' or
+                'total:sum(amount_total)'
+            groupby: Fields to group by; dates accept a granularity
+                (e.g., 'date_order:month')
+            offset: Number of groups to skip
+            limit: Maximum number of groups to return
+            orderby: Sorting criteria for the groups (e.g., 'amount_total desc')
+
+        Returns:
+            One dictionary per group with the group values, a 'count' and
+            the aggregated values
+
+        Examples:
+            >>> client = OdooClient(url, db, username, password)
+            >>> client.read_group('sale.order', [], ['amount_total:sum'], ['partner_id'])
+            [{'partner_id': [7, 'Azure Interior'], 'count': 3, 'amount_total': 4210.0}]
+        """
+        kwargs: dict[str, Any] = {"lazy": False}
+        if offset is not None:
+            kwargs["offset"] = offset
+        if limit is not None:
+            kwargs["limit"] = limit
+        if orderby is not None:
+            kwargs["orderby"] = orderby
+
+        groups = self._execute(
+            model_name, "read_group", domain, aggregates, groupby, **kwargs
+        )
+        return [
+            {
+                ("count" if key == "__count" else key): value
+                for key, value in group.items()
+                if key not in ("__domain", "__context", "__fold", "__range")
+            }
+            for group in groups
+        ]
+
+    def iter_search_read(
+        self,
+        model_name: str,
+        domain: list,
+        fields: Optional[list[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict]:
+        """
+        Iterate over every matching record using keyset pagination
+
+        Pages are fetched with ``id > last_id`` ordered by id, so each page
+        costs the same no matter how deep the scan is. With ``prefetch`` the
+        next page is requested while the caller consumes the current one.
+
+        Args:
+            model_name: Name of the model (e.g., 'res.partner')
+            domain: Search domain (e.g., [('is_company', '=', True)])
+            fields: List of field names to return, None for the default
+                projection or '*' for all fields
+            page_size: Number of records per search_read call (learned from
+                observed latency and payload size when omitted)
+            prefetch: Whether to fetch the next page in the background
+
+        Yields:
+            Record dictionaries in ascending id order
+
+        Examples:
+            >>> client = OdooClient(url, db, username, password)
+            >>> for record in client.iter_search_read('res.partner', [], ['name']):
+            ...     print(record['name'])
+        """
+        kwargs: dict[str, Any] = {"order": "id"}
+        fields = self._resolve_fields(model_name, fields)
+        if fields is not None:
+            kwargs["fields"] = fields
+        sizer_key = BatchSizer.key(model_name, fields) if page_size is None else None
+
+        def next_size() -> int:
+            if sizer_key is None:
+                return page_size
+            return self.batch_sizer.size_for(sizer_key, DEFAULT_PAGE_SIZE)
+
+        def fetch_page(last_id: int, size: int) -> list[dict]:
+            page_domain = list(domain) + [("id", ">", last_id)]
+            if sizer_key is None:
+                return self._execute(
+                    model_name, "search_read", page_domain, limit=size, **kwargs
+                )
+            return self._execute_measured(
+                sizer_key,
+                size,
+                model_name,
+                "search_read",
+                page_domain,
+                limit=size,
+                **kwargs,
+            )
+
+        prefetch = prefetch and not self._in_worker()
+        size = next_size()
+        pending: Optional[Future] = (
+            self._submit(fetch_page, 0, size) if prefetch else None
+        )
+        last_id = 0
+        while True:
+            page = (
+                pending.result() if pending is not None else fetch_page(last_id, size)
+            )
+            pending = None
+            if not page:
+                return
+            last_id = page[-1]["id"]
+            if len(page) < size:
+                yield from page
+                return
+            size = next_size()
+            if prefetch:
+                pending = self._submit(fetch_page, last_id, size)
+            yield from page
+
+    def scan(
+        self,
+        model_name: str,
+        domain: list,
+        fields: Any = None,
+        shards: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        ordered: bool = True,
+        page_size: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        Scan every matching record with concurrent id-range shards
+
+        The id space between the smallest and largest matching id is split
+        into ``shards`` ranges, each paged with iter_search_read on its own
+        worker. Records are streamed through bounded queues, so memory use
+        stays at a few pages per shard.
+
+        Args:
+            model_name: Name of the model (e.g., 'account.move.line')
+            domain: Search domain (e.g., [('parent_state', '=', 'posted')])
+            fields: List of field names to return, None for the default
+                projection or '*' for all fields
+            shards: Number of id ranges (defaults to parallelism)
+            parallelism: Maximum shards scanned at once (defaults to
+                max_workers); keep it below the number of Odoo workers
+            ordered: Yield records in ascending id order. When False,
+                records are yielded as soon as any shard returns them
+            page_size: Number of records per search_read call (learned
+                when omitted)
+
+        Yields:
+            Record dictionaries
+        """
+        parallelism = max(1, parallelism or self.max_workers)
+        shards = max(1, shards or parallelism)
+        fields = self._resolve_fields(model_name, fields) or ALL_FIELDS
+
+        first = self._execute(model_name, "search", domain, limit=1, order="id asc")
+        if not first:
+            return
+        last = self._execute(model_name, "search", domain, limit=1, order="id desc")
+        low, high = first[0], last[0] + 1
+        step = max(1, -(-(high - low) // shards))
+        ranges = [(start, min(start + step, high)) for start in range(low, high, step)]
+
+        batch_size = page_size or DEFAULT_PAGE_SIZE
+        done = object()
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=2) for _ in ranges] if ordered else None
+        shared: queue.Queue = queue.Queue(maxsize=2 * parallelism)
+
+        def put(target: queue.Queue, item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce(index: int) -> None:
+            start, end = ranges[index]
+            target = queues[index] if queues is not None else shared
+            shard_domain = list(domain) + [("id", ">=", start), ("id", "<", end)]
+            try:
+                page: list[dict] = []
+                for record in self.iter_search_read(
+                    model_name, shard_domain, fields, page_size=page_size
+                ):
+                    page.append(record)
+                    if len(page) >= batch_size:
+                        put(target, page)
+                        page = []
+                    if stop.is_set():
+                        return
+                if page:
+                    put(target, page)
+                put(target, done)
+            except Exception as e:
+                put(target, e)
+
+        executor = ThreadPoolExecutor(
+            max_workers=parallelism, thread_name_prefix="odoo-scan"
+        )
+        try:
+            for index in range(len(ranges)):
+                executor.submit(
+                    contextvars.copy_context().run, self._run_in_worker, produce, index
+                )
+            pending = len(ranges)
+            while pending:
+                source = queues[len(ranges) - pending] if queues is not None else shared
+                item = source.get()
+                if item is done:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield from item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def read_records(
+        self,
+        model_name,
+        ids,
+        fields=None,
+        chunk_size=None,
+        expand=None,
+        load=CLASSIC_READ,
+    ):
         """
         Read data of records by IDs
 
+        Large ID lists are split into chunks of ``chunk_size`` IDs that are
+        read concurrently; the merged result keeps the input order.
+
         Args:
             model_name: Name of the model (e.g., 'res.partner')
             ids: List of record IDs to read
-            fields: List of field names to return (None for all)
+            fields: List of field names to return, None for the default
+                projection or '*' for all fields
+            chunk_size: Maximum IDs per read call (learned from observed
+                latency and payload size, starting at read_chunk_size)
+            expand: Relational fields to replace by their records
+                (see expand_records)
+            load: None to read many2one values as plain IDs
 
         Returns:
             List of dictionaries with the requested records
 
+        Raises:
+            OdooBatchError: If any chunk fails. The records of the chunks
+                that succeeded and the per-chunk errors are attached.
+
         Examples:
             >>> client = OdooClient(url, db, username, password)
             >>> records = client.read_records('res.partner', [1])
             >>> print(records[0]['name'])
             'YourCompany'
         """
-        try:
-            kwargs = {}
-            if fields is not None:
-                kwargs["fields"] = fields
+        kwargs = {}
+        fields = self._resolve_fields(model_name, fields)
+        if fields is not None:
+            fields = _with_expanded_fields(fields, expand)
+            kwargs["fields"] = fields
+        _set_load(kwargs, load)
+
+        if self.cache is None:
+            records = self._read_chunked(model_name, list(ids), kwargs, chunk_size)
+            if expand:
+                records = self.expand_records(model_name, records, expand)
+            return records
+
+        if "load" in kwargs:
+            fields_key = make_key(sorted(fields or []), kwargs["load"])
+        else:
+            fields_key = make_key(sorted(fields) if fields is not None else None)
+        found, missing = self.cache.get_records(model_name, ids, fields_key)
+        if missing:
+            try:
+                result = self._read_chunked(model_name, missing, kwargs, chunk_size)
+            except OdooBatchError as e:
+                self.cache.set_records(model_name, e.results, fields_key)
+                found.update((rec["id"], rec) for rec in e.results)
+                e.results = [found[i] for i in ids if i in found]
+                raise
+            self.cache.set_records(model_name, result, fields_key)
+            found.update((rec["id"], rec) for rec in result)
+        records = [found[record_id] for record_id in ids if record_id in found]
+        if expand:
+            records = self.expand_records(model_name, records, expand)
+        return records
+
+    def display_names(self, model_name: str, ids: list[int]) -> dict[int, str]:
+        """
+        Display names of records, read in one batched call
 
-            result = self._execute(model_name, "read", ids, kwargs)
-            return result
-        except Exception as e:
-            print(f"Error reading records: {str(e)}", file=os.sys.stderr)
-            return []
+        Names go through read_records, so they are served from and stored in
+        the record cache when it is enabled.
+
+        Returns:
+            Mapping of record ID to display name
+        """
+        ids = sorted(set(ids))
+        if not ids:
+            return {}
+        rows = self.read_records(model_name, ids, ["display_name"])
+        return {row["id"]: row.get("display_name") or "" for row in rows}
+
+    def resolve_display_names(
+        self,
+        model_name: str,
+        records: list[dict],
+        fields: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Turn many2one IDs read with ``load=None`` into [id, display_name]
+
+        IDs are gathered across all rows and their names read with one
+        display_names call per related model.
+
+        Args:
+            model_name: Name of the model the records belong to
+            records: Records read with load=None
+            fields: many2one fields to resolve (all of them when omitted)
+
+        Returns:
+            Copies of the records with [id, display_name] many2one values
+        """
+        model_fields = self.get_model_fields(model_name)
+        if "error" in model_fields:
+            raise ValueError(
+                f"Cannot resolve names of {model_name}: {model_fields['error']}"
+            )
+
+        relations: dict[str, str] = {}
+        for field_name in fields or model_fields:
+            meta = model_fields.get(field_name) or {}
+            if meta.get("type") != "many2one":
+                if fields:
+                    raise ValueError(
+                        f"{model_name}.{field_name} is not a many2one field"
+                    )
+                continue
+            relations[field_name] = meta["relation"]
+
+        wanted: dict[str, set] = {}
+        for field_name, relation in relations.items():
+            ids = wanted.setdefault(relation, set())
+            for record in records:
+                value = record.get(field_name)
+                if isinstance(value, int) and not isinstance(value, bool):
+                    ids.add(value)
+        names = {
+            relation: self.display_names(relation, list(ids))
+            for relation, ids in wanted.items()
+        }
+
+        resolved = []
+        for record in records:
+            record = dict(record)
+            for field_name, relation in relations.items():
+                value = record.get(field_name)
+                if isinstance(value, int) and not isinstance(value, bool):
+                    record[field_name] = [value, names[relation].get(value, "")]
+            resolved.append(record)
+        return resolved
+
+    def bulk_create(
+        self, model_name: str, vals_list: list[dict], chunk_size: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        Create many records with list-of-values create calls
+
+        The values are split into chunks that are created concurrently.
+        Failed chunks do not stop the others; their values are returned so
+        the call can be resumed with only what is left.
+
+        Args:
+            model_name: Name of the model (e.g., 'res.partner')
+            vals_list: One values dictionary per record to create
+            chunk_size: Records per create call (defaults to write_chunk_size)
+
+        Returns:
+            Dictionary containing:
+            - success: Boolean indicating that every chunk succeeded
+            - ids: Created IDs, in input order of the successful chunks
+            - failed: One entry per failed chunk with its offset, size and error
+            - remaining: Values of the failed chunks, to pass to a new call
+        """
+        chunk_size = chunk_size or self.write_chunk_size
+        chunks = chunked(list(vals_list), chunk_size)
+        outcomes = self._run_parallel(
+            lambda chunk: self._execute(model_name, "create", chunk), chunks
+        )
+
+        ids: list[int] = []
+        failed: list[dict] = []
+        remaining: list[dict] = []
+        for index, (chunk, (result, error)) in enumerate(zip(chunks, outcomes)):
+            if error is None:
+                ids.extend(result if isinstance(result, list) else [result])
+            else:
+                failed.append(
+                    {
+                        "chunk": index,
+                        "offset": index * chunk_size,
+                        "size": len(chunk),
+                        "error": str(error),
+                    }
+                )
+                remaining.extend(chunk)
+
+        if self.cache is not None and ids:
+            self.cache.invalidate_model(model_name)
+        return {
+            "success": not failed,
+            "ids": ids,
+            "failed": failed,
+            "remaining": remaining,
+        }
+
+    def bulk_write(
+        self, model_name: str, updates: list[dict], chunk_size: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        Update many records, grouping records that receive identical values
+
+        Each group of records with the same values is written with a single
+        write(ids, vals) call per chunk of IDs, and calls run concurrently.
+
+        Args:
+            model_name: Name of the model (e.g., 'res.partner')
+            updates: Entries of the form {"id": 7, "vals": {...}} or
+                {"ids": [7, 8], "vals": {...}}
+            chunk_size: IDs per write call (defaults to write_chunk_size)
+
+        Returns:
+            Dictionary containing:
+            - success: Boolean indicating that every write succeeded
+            - updated: Number of records written
+            - calls: Number of write calls issued
+            - failed: {"ids", "vals", "error"} entries that can be passed back
+              as updates to resume
+        """
+        chunk_size = chunk_size or self.write_chunk_size
+
+        groups: dict[str, tuple[dict, list[int]]] = {}
+        for update in updates:
+            ids = update["ids"] if "ids" in update else [update["id"]]
+            vals = update.get("vals") or {}
+            groups.setdefault(make_key(vals), (vals, []))[1].extend(ids)
+
+        calls = [
+            (ids, vals)
+            for vals, group_ids in groups.values()
+            for ids in chunked(list(dict.fromkeys(group_ids)), chunk_size)
+        ]
+        outcomes = self._run_parallel(
+            lambda call: self._execute(model_name, "write", call[0], call[1]), calls
+        )
+
+        updated = 0
+        failed: list[dict] = []
+        for (ids, vals), (_result, error) in zip(calls, outcomes):
+            if error is None:
+                updated += len(ids)
+            else:
+                failed.append({"ids": ids, "vals": vals, "error": str(error)})
+
+        if self.cache is not None:
+            self.cache.invalidate_records(
+                model_name, [i for ids, _vals in calls for i in ids]
+            )
+        return {
+            "success": not failed,
+            "updated": updated,
+            "calls": len(calls),
+            "failed": failed,
+        }
+
+    def expand_records(
+        self, model_name: str, records: list[dict], expand: dict[str, Any]
+    ) -> list[dict]:
+        """
+        Replace relational field values by the related records
+
+        Related IDs are gathered across all rows and read with one batched
+        read per related model, so the number of calls depends on the depth
+        of the expansion rather than on the number of rows.
+
+        Args:
+            model_name: Name of the model the records belong to
+            records: Records as returned by read or search_read
+            expand: Mapping of relational field name to the fields to read
+                on the related model: a list of field names, None for the
+                default projection, '*' for all fields, or
+                {"fields": [...], "expand": {...}} to expand
+                the related records further
+
+        Returns:
+            Copies of the records where many2one values are replaced by a
+            record dictionary (or False) and x2many values by a list of
+            record dictionaries
+
+        Examples:
+            >>> client.expand_records('sale.order', orders, {
+            ...     'partner_id': ['name', 'email'],
+            ...     'order_line': {
+            ...         'fields': ['product_id', 'price_subtotal'],
+            ...         'expand': {'product_id': ['default_code', 'categ_id']},
+            ...     },
+            ... })
+        """
+        model_fields = self.get_model_fields(model_name)
+        if "error" in model_fields:
+            raise ValueError(f"Cannot expand {model_name}: {model_fields['error']}")
+
+        # Parse specs and group the related IDs by model
+        specs = {}
+        wanted: dict[str, tuple[set, Optional[set]]] = {}
+        for field_name, spec in expand.items():
+            relation = (model_fields.get(field_name) or {}).get("relation")
+            if not relation:
+                raise ValueError(f"{model_name}.{field_name} is not a relational field")
+            if isinstance(spec, dict):
+                sub_fields, sub_expand = spec.get("fields"), spec.get("expand")
+            else:
+                sub_fields, sub_expand = spec, None
+            sub_fields = self._resolve_fields(relation, sub_fields)
+            if sub_fields is not None:
+                sub_fields = _with_expanded_fields(sub_fields, sub_expand)
+            specs[field_name] = (relation, sub_fields, sub_expand)
+
+            ids, fields = wanted.setdefault(relation, (set(), set()))
+            for record in records:
+                ids.update(_relational_ids(record.get(field_name)))
+            if sub_fields is None or fields is None:
+                wanted[relation] = (ids, None)
+            else:
+                fields.update(sub_fields)
+
+        # One batched read per related model
+        related: dict[str, dict[int, dict]] = {}
+        for relation, (ids, fields) in wanted.items():
+            rows = self.read_records(
+                relation,
+                sorted(ids),
+                sorted(fields) if fields is not None else ALL_FIELDS,
+            )
+            related[relation] = {row["id"]: row for row in rows}
+
+        # Expand the next level, then stitch related records into copies
+        expanded = [dict(record) for record in records]
+        for field_name, (relation, _sub_fields, sub_expand) in specs.items():
+            by_id = related[relation]
+            if sub_expand:
+                rows = self.expand_records(relation, list(by_id.values()), sub_expand)
+                by_id = {row["id"]: row for row in rows}
+            field_type = model_fields[field_name].get("type")
+            for record in expanded:
+                ids = _relational_ids(record.get(field_name))
+                if field_type == "many2one":
+                    record[field_name] = by_id.get(ids[0], False) if ids else False
+                else:
+                    record[field_name] = [by_id[i] for i in ids if i in by_id]
+        return expanded
+
+
+class _CountingResponse:
+    """HTTP response wrapper counting the bytes read from it"""
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self.count = 0
+
+    def read(self, *args: Any) -> bytes:
+        data = self._response.read(*args)
+        self.count += len(data)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
 
 
 class RedirectTransport(xmlrpc.client.Transport):
     """Transport that adds timeout, SSL verification, and redirect handling"""
 
+    # Size in bytes of the last response body, used for batch sizing
+    last_response_size = 0
+
     def __init__(
         self, timeout=10, use_https=True, verify_ssl=True, max_redirects=5, proxy=None
     ):
@@ -346,6 +1461,13 @@ class RedirectTransport(xmlrpc.client.Transport):
 
         return connection
 
+    def parse_response(self, response):
+        counting = _CountingResponse(response)
+        try:
+            return super().parse_response(counting)
+        finally:
+            self.last_response_size = counting.count
+
     def request(self, host, handler, request_body, verbose):
         """Send HTTP request with retry for redirects"""
         redirects = 0
@@ -422,11 +1544,32 @@ def get_odoo_client():
 
     # Get additional options from environment variables
     timeout = int(os.environ.get("ODOO_TIMEOUT", "30"))
+    max_workers = int(os.environ.get("ODOO_MAX_WORKERS", "4"))
+    read_chunk_size = int(os.environ.get("ODOO_READ_CHUNK_SIZE", "1000"))
+    write_chunk_size = int(os.environ.get("ODOO_WRITE_CHUNK_SIZE", "100"))
+    target_latency = float(os.environ.get("ODOO_TARGET_LATENCY", "1.0"))
+    max_response_bytes = int(os.environ.get("ODOO_MAX_RESPONSE_BYTES", "8388608"))
+    count_ttl = float(os.environ.get("ODOO_COUNT_CACHE_TTL", "30"))
+    limits = parse_limits(os.environ.get("ODOO_LIMITS", ""))
+    admission_queue = int(os.environ.get("ODOO_ADMISSION_QUEUE", "32"))
+    admission_timeout = float(os.environ.get("ODOO_ADMISSION_TIMEOUT", "30"))
+    adaptive_raw = os.environ.get("ODOO_ADAPTIVE_CONCURRENCY", "0")
+    adaptive_enabled = adaptive_raw.lower() in ["1", "true", "yes"]
+    min_concurrency = int(os.environ.get("ODOO_MIN_CONCURRENCY", "1"))
+    max_concurrency = int(os.environ.get("ODOO_MAX_CONCURRENCY", "32"))
 
     # Parse verify_ssl value
     verify_ssl_raw = os.environ.get("ODOO_VERIFY_SSL", "1")
     verify_ssl = verify_ssl_raw.lower() in ["1", "true", "yes"]
 
+    # Caching is disabled unless a TTL is configured
+    cache_ttl = float(os.environ.get("ODOO_CACHE_TTL", "0"))
+    cache_backend = os.environ.get("ODOO_CACHE_BACKEND", "memory")
+    cache_url = os.environ.get("ODOO_CACHE_URL")
+    cache_max_entries = int(os.environ.get("ODOO_CACHE_MAX_ENTRIES", "100000"))
+    bus_channels = os.environ.get("ODOO_BUS_CHANNELS", "")
+    bus_mode = os.environ.get("ODOO_BUS_MODE", "longpolling")
+
     # Print configuration in a single block
     print("Odoo client configuration:", file=os.sys.stderr)
     print(f"  URL: {config['url']}", file=os.sys.stderr)
@@ -434,16 +1577,63 @@ def get_odoo_client():
     print(f"  Username: {config['username']}", file=os.sys.stderr)
     print(f"  Timeout: {timeout}s", file=os.sys.stderr)
     print(f"  Verify SSL: {verify_ssl}", file=os.sys.stderr)
+    print(f"  Max workers: {max_workers}", file=os.sys.stderr)
+    print(f"  Cache TTL: {cache_ttl}s ({cache_backend})", file=os.sys.stderr)
+    if limits:
+        print(f"  Limits: {', '.join(limits)}", file=os.sys.stderr)
+    if bus_channels:
+        print(f"  Bus channels ({bus_mode}): {bus_channels}", file=os.sys.stderr)
 
     try:
-        return OdooClient(
+        client = OdooClient(
             url=config["url"],
             db=config["db"],
             username=config["username"],
             password=config["password"],
             timeout=timeout,
             verify_ssl=verify_ssl,
+            max_workers=max_workers,
+            read_chunk_size=read_chunk_size,
+            write_chunk_size=write_chunk_size,
+            batch_sizer=BatchSizer(
+                target_latency=target_latency, max_bytes=max_response_bytes
+            ),
+            count_ttl=count_ttl,
+            admission=AdmissionController(
+                limits,
+                max_queue=admission_queue,
+                timeout=admission_timeout,
+                adaptive=(
+                    AdaptiveLimiter(
+                        min_limit=min_concurrency,
+                        max_limit=max_concurrency,
+                        max_queue=admission_queue,
+                    )
+                    if adaptive_enabled
+                    else None
+                ),
+            ),
+            cache=(
+                create_cache(
+                    cache_ttl,
+                    cache_backend,
+                    cache_url,
+                    scope=config["db"],
+                    max_entries=cache_max_entries,
+                )
+                if cache_ttl > 0
+                else None
+            ),
         )
     except Exception as e:
         print(f"Error creating Odoo client: {str(e)}", file=os.sys.stderr)
         raise
+
+    if client.cache is not None and bus_channels:
+        from .bus import BusListener, parse_channels
+
+        BusListener(
+            client, client.cache, parse_channels(bus_channels), mode=bus_mode
+        ).start()
+
+    return client
@@ -0,0 +1,290 @@
+"""
+Response budgets and continuation cursors for large search_read results
+
+A search_read whose result would go over the row or byte budget returns its
+first page with an opaque cursor. The cursor carries the query (model,
+domain, fields, order) and the keyset position of the last returned record,
+so each continuation reads the next page directly instead of re-running the
+query with a growing offset. Orders that cannot be resumed by keyset
+(relational, boolean or translated fields, nullable numbers) fall back to an
+offset position.
+"""
+
+import base64
+import binascii
+import json
+import os
+import re
+from typing import Any, Optional
+
+from . import serialization
+
+CURSOR_VERSION = 1
+DEFAULT_MAX_ROWS = 1000
+DEFAULT_MAX_BYTES = 256 * 1024
+
+# Positional parameters of search_read after the domain
+_SEARCH_READ_PARAMS = ("fields", "offset", "limit", "order")
+
+# Field types whose read value compares like the SQL column, with False
+# standing for NULL
+_KEYSET_TYPES = {"char", "text", "date", "datetime", "selection"}
+# Numeric fields read NULL as 0, so they can only be used when required
+_REQUIRED_KEYSET_TYPES = {"integer", "float", "monetary"}
+
+_ORDER_TERM = re.compile(r"^([a-z_][a-z0-9_]*)(?:\s+(asc|desc))?$", re.IGNORECASE)
+
+
+def get_budget() -> tuple[int, int]:
+    """
+    Row and byte budget of a single response
+
+    Read from ODOO_RESULT_MAX_ROWS and ODOO_RESULT_MAX_BYTES; 0 disables
+    the corresponding limit.
+    """
+    max_rows = int(os.environ.get("ODOO_RESULT_MAX_ROWS", DEFAULT_MAX_ROWS))
+    max_bytes = int(os.environ.get("ODOO_RESULT_MAX_BYTES", DEFAULT_MAX_BYTES))
+    return max_rows, max_bytes
+
+
+def encode_cursor(query: dict[str, Any]) -> str:
+    """Pack a query and its position into an opaque, URL-safe token"""
+    text = serialization.dumps(query, pretty=False)
+    return base64.urlsafe_b64encode(text.encode()).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Unpack a token made by encode_cursor
+
+    Raises:
+        ValueError: If the token is malformed or from another version
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        query = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(query, dict) or query.get("v") != CURSOR_VERSION:
+        raise ValueError("Invalid cursor")
+    return query
+
+
+def parse_order(order: Optional[str]) -> Optional[list[tuple[str, bool]]]:
+    """
+    Split an order clause into (field, descending) pairs
+
+    Returns:
+        The pairs, or None when a term is not a plain field name with an
+        optional direction (related paths, NULLS FIRST/LAST, ...)
+
+    Examples:
+        >>> parse_order("date desc, name")
+        [('date', True), ('name', False)]
+    """
+    terms = []
+    for term in (order or "").split(","):
+        match = _ORDER_TERM.match(term.strip())
+        if match is None:
+            return None
+        terms.append((match.group(1), (match.group(2) or "").lower() == "desc"))
+    return terms
+
+
+def _keyset_spec(
+    order_terms: list[tuple[str, bool]], model_fields: dict[str, Any]
+) -> Optional[list[list]]:
+    """[field, descending, nullable] per order term, None if not resumable by keyset"""
+    spec = []
+    for name, desc in order_terms:
+        if name == "id":
+            spec.append([name, desc, False])
+            continue
+        meta = model_fields.get(name)
+        if not isinstance(meta, dict) or not meta.get("store", True):
+            return None
+        if meta.get("translate"):
+            return None
+        kind = meta.get("type")
+        required = bool(meta.get("required"))
+        if kind in _REQUIRED_KEYSET_TYPES and required:
+            spec.append([name, desc, False])
+        elif kind in _KEYSET_TYPES:
+            spec.append([name, desc, not required])
+        else:
+            return None
+    return spec
+
+
+def _and(expressions: list[list]) -> list:
+    return ["&"] * (len(expressions) - 1) + [t for e in expressions for t in e]
+
+
+def _or(expressions: list[list]) -> list:
+    return ["|"] * (len(expressions) - 1) + [t for e in expressions for t in e]
+
+
+def _after(name: str, desc: bool, nullable: bool, value: Any) -> Optional[list]:
+    """Domain of the values sorted strictly after value, None if there are none"""
+    # PostgreSQL sorts NULL last in ascending and first in descending order
+    if value is False or value is None:
+        return None if not desc else [[name, "!=", False]]
+    if desc:
+        return [[name, "<", value]]
+    if nullable:
+        return _or([[[name, ">", value]], [[name, "=", False]]])
+    return [[name, ">", value]]
+
+
+def keyset_domain(spec: list[list], values: list[Any]) -> list:
+    """
+    Domain of the records sorted after the given order values
+
+    Args:
+        spec: [field, descending, nullable] per order term, ending with id
+        values: Values of those fields on the last record read
+
+    Examples:
+        >>> keyset_domain([["id", False, False]], [42])
+        [['id', '>', 42]]
+    """
+    branches = []
+    for index, (name, desc, nullable) in enumerate(spec):
+        after = _after(name, desc, nullable, values[index])
+        if after is not None:
+            equal = [[[n, "=", v]] for (n, _d, _n), v in zip(spec, values[:index])]
+            branches.append(_and(equal + [after]))
+    return _or(branches)
+
+
+def build_query(client: Any, model: str, args: list, kwargs: dict) -> dict[str, Any]:
+    """
+    Turn the arguments of a search_read call into a resumable query
+
+    An ``id`` term is appended to the order so pages never overlap; without
+    an order, records are sorted by id.
+
+    Args:
+        client: Connected OdooClient
+        model: The model name (e.g., 'res.partner')
+        args: Positional search_read arguments (domain, fields, offset,
+            limit, order)
+        kwargs: Keyword search_read arguments
+
+    Returns:
+        Query dictionary for fetch_page
+    """
+    kwargs = dict(kwargs)
+    domain = args[0] if args else kwargs.pop("domain", [])
+    for name, value in zip(_SEARCH_READ_PARAMS, args[1:]):
+        kwargs[name] = value
+    fields = kwargs.pop("fields", None) or None
+    offset = kwargs.pop("offset", 0) or 0
+    limit = kwargs.pop("limit", None) or None
+    order = kwargs.pop("order", None) or None
+
+    order_terms = parse_order(order) if order else []
+    if order_terms is None:
+        if "id" not in [term.split()[0] for term in order.split(",") if term.strip()]:
+            order = f"{order}, id"
+    elif "id" not in [name for name, _ in order_terms]:
+        order_terms.append(("id", False))
+        order = ", ".join(f"{name} {'desc' if d else 'asc'}" for name, d in order_terms)
+
+    spec = None
+    if order_terms is not None:
+        model_fields = {}
+        if any(name != "id" for name, _ in order_terms):
+            model_fields = client.get_model_fields(model)
+        if "error" not in model_fields:
+            spec = _keyset_spec(order_terms, model_fields)
+
+    # Order fields are read to know the keyset position, then dropped; Odoo
+    # always returns the id
+    hidden = []
+    if spec is not None and fields is not None:
+        hidden = [n for n, _d, _n in spec if n != "id" and n not in fields]
+
+    return {
+        "v": CURSOR_VERSION,
+        "model": model,
+        "domain": list(domain),
+        "fields": fields,
+        "order": order,
+        "kwargs": kwargs,
+        "keyset": spec,
+        "hidden": hidden,
+        "after": None,
+        "offset": offset,
+        "limit": limit,
+    }
+
+
+def fetch_page(
+    client: Any, query: dict[str, Any], max_rows: int, max_bytes: int
+) -> tuple[list[dict], Optional[str]]:
+    """
+    Read the next page of a query within the response budget
+
+    At least one record is returned even when it alone exceeds max_bytes.
+
+    Args:
+        client: Connected OdooClient
+        query: Query from build_query or decode_cursor
+        max_rows: Maximum records per page (0 for no limit)
+        max_bytes: Maximum serialized size of the page (0 for no limit)
+
+    Returns:
+        The records and the cursor of the next page, or None when the
+        query is exhausted
+    """
+    remaining = query["limit"]
+    limits = [n for n in (max_rows, remaining) if n]
+    size = min(limits) if limits else 0
+
+    domain = list(query["domain"])
+    if query["after"] is not None:
+        domain += keyset_domain(query["keyset"], query["after"])
+    kwargs = dict(query["kwargs"], order=query["order"])
+    if query["fields"] is not None:
+        kwargs["fields"] = list(query["fields"]) + query["hidden"]
+    if query["offset"]:
+        kwargs["offset"] = query["offset"]
+    if size:
+        # One more record tells whether there is a next page
+        kwargs["limit"] = size + 1
+
+    records = client.execute_method(query["model"], "search_read", domain, **kwargs)
+    more = bool(size) and len(records) > size
+    records = records[:size] if size else records
+
+    if max_bytes:
+        used = 2
+        for index, record in enumerate(records):
+            used += len(serialization.dumps(record, pretty=False).encode()) + 1
+            if used > max_bytes and index:
+                records = records[:index]
+                more = True
+                break
+
+    if more and remaining is not None:
+        more = remaining > len(records)
+
+    next_cursor = None
+    if more:
+        state = dict(query)
+        if remaining is not None:
+            state["limit"] = remaining - len(records)
+        if query["keyset"] is not None:
+            last = records[-1]
+            state["after"] = [last.get(name) for name, _d, _n in query["keyset"]]
+            state["offset"] = 0
+        else:
+            state["offset"] = (query["offset"] or 0) + len(records)
+        next_cursor = encode_cursor(state)
+
+    if query["hidden"]:
+        for record in records:
+            for name in query["hidden"]:
+                record.pop(name, None)
+    return records, next_cursor
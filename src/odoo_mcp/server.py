@@ -4,19 +4,35 @@ MCP server for Odoo integration
 Provides MCP tools and resources for interacting with Odoo ERP systems
 """
 
+import contextvars
 import json
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from mcp.server.fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+)
 
-from .odoo_client import OdooClient, get_odoo_client
+from . import attachments, export, pagination, serialization
+from .admission import BULK, INTERACTIVE
+from .odoo_client import OdooBatchError, OdooClient, get_odoo_client
+from .workers import get_tool_pool, offload
 
 # Global client cache for lazy initialization
 _odoo_client_cache: Optional[OdooClient] = None
+# Handlers run concurrently on the tool pool; only one may build the client
+_odoo_client_lock = threading.Lock()
 
 
 def get_or_create_odoo_client() -> OdooClient:
@@ -26,7 +42,9 @@ def get_or_create_odoo_client() -> OdooClient:
     """
     global _odoo_client_cache
     if _odoo_client_cache is None:
-        _odoo_client_cache = get_odoo_client()
+        with _odoo_client_lock:
+            if _odoo_client_cache is None:
+                _odoo_client_cache = get_odoo_client()
     return _odoo_client_cache
 
 
@@ -43,8 +61,6 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     Application lifespan for initialization and cleanup
     Lazy initialization - Odoo client is created on first use
     """
-    import sys
-
     print("Odoo MCP Server ready (lazy connection mode)", file=sys.stderr)
 
     try:
@@ -66,30 +82,47 @@ mcp = FastMCP(
 # ----- MCP Resources -----
 
 
+def _dump_records(
+    odoo_client: OdooClient, model_name: str, records: Any, columnar: bool = False
+) -> str:
+    """Serialize records, keeping boolean fields when False is written as null"""
+    if serialization.false_as_null_default():
+        records = serialization.false_to_null(
+            records, odoo_client.field_types(model_name)
+        )
+    if columnar:
+        records = serialization.to_columnar(records)
+    return serialization.dumps(records)
+
+
 @mcp.resource(
-    "odoo://models", description="List all available models in the Odoo system"
+    "odoo://models",
+    description="List all available models in the Odoo system",
+    mime_type="application/json",
 )
+@offload(priority=INTERACTIVE)
 def get_models() -> str:
     """Lists all available models in the Odoo system"""
     try:
         odoo_client = get_or_create_odoo_client()
         models = odoo_client.get_models()
-        return json.dumps(models, indent=2)
+        return serialization.dumps(models)
     except ConnectionError as e:
-        return json.dumps(
+        return serialization.dumps(
             {
                 "error": "Odoo connection failed",
                 "message": str(e),
                 "hint": "Make sure Odoo is running and accessible",
             },
-            indent=2,
         )
 
 
 @mcp.resource(
     "odoo://model/{model_name}",
     description="Get detailed information about a specific model including fields",
+    mime_type="application/json",
 )
+@offload(priority=INTERACTIVE)
 def get_model_info(model_name: str) -> str:
     """
     Get information about a specific model
@@ -103,7 +136,7 @@ def get_model_info(model_name: str) -> str:
         model_info = odoo_client.get_model_info(model_name)
 
         if "error" in model_info:
-            return json.dumps(model_info, indent=2)
+            return serialization.dumps(model_info)
 
         # Get field definitions separately
         try:
@@ -113,24 +146,25 @@ def get_model_info(model_name: str) -> str:
         except Exception as field_error:
             model_info["fields_error"] = str(field_error)
 
-        return json.dumps(model_info, indent=2)
+        return serialization.dumps(model_info)
     except ConnectionError as e:
-        return json.dumps(
+        return serialization.dumps(
             {
                 "error": "Odoo connection failed",
                 "message": str(e),
                 "hint": "Make sure Odoo is running and accessible",
             },
-            indent=2,
         )
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return serialization.dumps({"error": str(e)})
 
 
 @mcp.resource(
     "odoo://record/{model_name}/{record_id}",
     description="Get detailed information of a specific record by ID",
+    mime_type="application/json",
 )
+@offload(priority=INTERACTIVE)
 def get_record(model_name: str, record_id: str) -> str:
     """
     Get a specific record by ID
@@ -144,18 +178,20 @@ def get_record(model_name: str, record_id: str) -> str:
         record_id_int = int(record_id)
         record = odoo_client.read_records(model_name, [record_id_int])
         if not record:
-            return json.dumps(
-                {"error": f"Record not found: {model_name} ID {record_id}"}, indent=2
+            return serialization.dumps(
+                {"error": f"Record not found: {model_name} ID {record_id}"}
             )
-        return json.dumps(record[0], indent=2)
+        return _dump_records(odoo_client, model_name, record[0])
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return serialization.dumps({"error": str(e)})
 
 
 @mcp.resource(
     "odoo://search/{model_name}/{domain}",
     description="Search for records matching the domain",
+    mime_type="application/json",
 )
+@offload(priority=INTERACTIVE)
 def search_records_resource(model_name: str, domain: str) -> str:
     """
     Search for records that match a domain
@@ -175,9 +211,47 @@ def search_records_resource(model_name: str, domain: str) -> str:
         # Perform search_read for efficiency
         results = odoo_client.search_read(model_name, domain_list, limit=limit)
 
-        return json.dumps(results, indent=2)
+        return _dump_records(odoo_client, model_name, results)
+    except Exception as e:
+        return serialization.dumps({"error": str(e)})
+
+
+@mcp.resource(
+    "odoo://search/{model_name}/{domain}/columnar",
+    description="Search for records matching the domain, as fields and rows",
+    mime_type="application/json",
+)
+@offload(priority=INTERACTIVE)
+def search_records_columnar_resource(model_name: str, domain: str) -> str:
+    """
+    Search for records and return them in columnar form
+
+    Parameters:
+        model_name: Name of the Odoo model (e.g., 'res.partner')
+        domain: Search domain in JSON format (e.g., '[[\"name\", \"ilike\", \"test\"]]')
+    """
+    odoo_client = get_or_create_odoo_client()
+    try:
+        domain_list = json.loads(domain)
+        results = odoo_client.search_read(model_name, domain_list, limit=10)
+        return _dump_records(odoo_client, model_name, results, columnar=True)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return serialization.dumps({"error": str(e)})
+
+
+@mcp.resource(
+    "odoo://metrics",
+    description="Load metrics: handler queue, calls in flight toward Odoo, limits and connections",
+    mime_type="application/json",
+)
+def get_metrics() -> str:
+    """Report the tool worker pool and the calls in flight toward Odoo"""
+    metrics: Dict[str, Any] = {"tool_pool": get_tool_pool().metrics()}
+    # Never connect just to report metrics
+    if _odoo_client_cache is not None:
+        metrics["admission"] = _odoo_client_cache.admission.snapshot()
+        metrics["connections"] = _odoo_client_cache.proxy_pool.snapshot()
+    return serialization.dumps(metrics)
 
 
 # ----- Pydantic models for type safety -----
@@ -210,6 +284,21 @@ class SearchDomain(BaseModel):
         return [condition.to_tuple() for condition in self.conditions]
 
 
+class BatchOperation(BaseModel):
+    """A single operation of a batch_execute call"""
+
+    model: str = Field(description="The model name (e.g., 'res.partner')")
+    method: str = Field(description="Method name to execute")
+    args: List = Field(
+        default_factory=list,
+        description='Positional arguments. {"$ref": index} is replaced by the '
+        "result of an earlier operation",
+    )
+    kwargs: Dict[str, Any] = Field(
+        default_factory=dict, description="Keyword arguments"
+    )
+
+
 class EmployeeSearchResult(BaseModel):
     """Represents a single employee search result."""
 
@@ -228,17 +317,31 @@ class SearchEmployeeResponse(BaseModel):
 
 
 class Holiday(BaseModel):
-    """Represents a single holiday."""
+    """Represents a single holiday, validated straight from hr.leave rows."""
 
     display_name: str = Field(description="Display name of the holiday")
-    start_datetime: str = Field(description="Start date and time of the holiday")
-    stop_datetime: str = Field(description="End date and time of the holiday")
+    start_datetime: str = Field(
+        validation_alias=AliasChoices("start_datetime", "date_from"),
+        description="Start date and time of the holiday",
+    )
+    stop_datetime: str = Field(
+        validation_alias=AliasChoices("stop_datetime", "date_to"),
+        description="End date and time of the holiday",
+    )
     employee_id: List[Union[int, str]] = Field(
         description="Employee ID associated with the holiday"
     )
     name: str = Field(description="Name of the holiday")
     state: str = Field(description="State of the holiday")
 
+    @field_validator("employee_id", "name", mode="before")
+    @classmethod
+    def _empty_odoo_value(cls, value: Any, info: ValidationInfo) -> Any:
+        # Odoo returns False for an empty description or employee
+        if value is False:
+            return [] if info.field_name == "employee_id" else ""
+        return value
+
 
 class SearchHolidaysResponse(BaseModel):
     """Response model for the search_holidays tool."""
@@ -250,10 +353,135 @@ class SearchHolidaysResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="Error message, if any")
 
 
+# Validate whole result lists in one call instead of one model per row
+_employee_results = TypeAdapter(List[EmployeeSearchResult])
+_holidays = TypeAdapter(List[Holiday])
+
+# hr.leave fields read for Holiday
+HOLIDAY_FIELDS = [
+    "display_name",
+    "date_from",
+    "date_to",
+    "employee_id",
+    "name",
+    "state",
+]
+
+
+# ----- Domain helpers -----
+
+SEARCH_METHODS = ["search", "search_count", "search_read"]
+
+
+def normalize_domain(domain: Any) -> List:
+    """
+    Normalize a search domain given in any of the accepted formats
+
+    Accepts a list of conditions, a single [field, operator, value] list,
+    a {"conditions": [...]} object, or a JSON/Python literal string of
+    either. Invalid conditions are dropped.
+    """
+    domain_list = []
+
+    # Check if domain is wrapped unnecessarily ([domain] instead of domain)
+    if isinstance(domain, list) and len(domain) == 1 and isinstance(domain[0], list):
+        # Case [[domain]] - unwrap to [domain]
+        domain = domain[0]
+
+    # Normalize domain similar to search_records function
+    if domain is None:
+        domain_list = []
+    elif isinstance(domain, dict):
+        if "conditions" in domain:
+            # Object format
+            conditions = domain.get("conditions", [])
+            domain_list = []
+            for cond in conditions:
+                if isinstance(cond, dict) and all(
+                    k in cond for k in ["field", "operator", "value"]
+                ):
+                    domain_list.append([cond["field"], cond["operator"], cond["value"]])
+    elif isinstance(domain, list):
+        # List format
+        if not domain:
+            domain_list = []
+        elif all(isinstance(item, list) for item in domain) or any(
+            item in ["&", "|", "!"] for item in domain
+        ):
+            domain_list = domain
+        elif len(domain) >= 3 and isinstance(domain[0], str):
+            # Case [field, operator, value] (not [[field, operator, value]])
+            domain_list = [domain]
+    elif isinstance(domain, str):
+        # String format (JSON)
+        try:
+            parsed_domain = json.loads(domain)
+            if isinstance(parsed_domain, dict) and "conditions" in parsed_domain:
+                conditions = parsed_domain.get("conditions", [])
+                domain_list = []
+                for cond in conditions:
+                    if isinstance(cond, dict) and all(
+                        k in cond for k in ["field", "operator", "value"]
+                    ):
+                        domain_list.append(
+                            [cond["field"], cond["operator"], cond["value"]]
+                        )
+            elif isinstance(parsed_domain, list):
+                domain_list = parsed_domain
+        except json.JSONDecodeError:
+            try:
+                import ast
+
+                # noqa: S307 - Used safely with literal only
+                parsed_domain = ast.literal_eval(domain)
+                if isinstance(parsed_domain, list):
+                    domain_list = parsed_domain
+            except (ValueError, SyntaxError):
+                domain_list = []
+
+    # Validate domain_list
+    if domain_list:
+        valid_conditions = []
+        for cond in domain_list:
+            if isinstance(cond, str) and cond in ["&", "|", "!"]:
+                valid_conditions.append(cond)
+                continue
+
+            if (
+                isinstance(cond, list)
+                and len(cond) == 3
+                and isinstance(cond[0], str)
+                and isinstance(cond[1], str)
+            ):
+                valid_conditions.append(cond)
+
+        domain_list = valid_conditions
+
+    return domain_list
+
+
+def normalize_search_args(method: str, args: List) -> List:
+    """Normalize the domain passed as first positional argument of search methods"""
+    # Special handling for search methods like search, search_count, search_read
+    if method not in SEARCH_METHODS or not args:
+        return args
+
+    # Search methods usually have domain as the first parameter
+    # args: [[domain], limit, offset, ...] or [domain, limit, offset, ...]
+    normalized_args = list(args)  # Create a copy to avoid affecting the original args
+    domain_list = normalize_domain(normalized_args[0])
+    normalized_args[0] = domain_list
+
+    # Log for debugging; stdout carries the JSON-RPC stream on stdio
+    print(f"Executing {method} with normalized domain: {domain_list}", file=sys.stderr)
+    return normalized_args
+
+
 # ----- MCP Tools -----
 
 
 @mcp.tool(description="Execute a custom method on an Odoo model")
+@offload
 def execute_method(
     ctx: Context,
     model: str,
@@ -274,6 +502,8 @@ def execute_method(
         Dictionary containing:
         - success: Boolean indicating success
         - result: Result of the method (if success)
+        - next_cursor: For search_read results over the response budget,
+          cursor to pass to continue_query for the next page
         - error: Error message (if failure)
     """
     try:
@@ -289,109 +519,12 @@ def execute_method(
         args = args or []
         kwargs = kwargs or {}
 
-        # Special handling for search methods like search, search_count, search_read
-        search_methods = ["search", "search_count", "search_read"]
-        if method in search_methods and args:
-            # Search methods usually have domain as the first parameter
-            # args: [[domain], limit, offset, ...] or [domain, limit, offset, ...]
-            normalized_args = list(
-                args
-            )  # Create a copy to avoid affecting the original args
-
-            if len(normalized_args) > 0:
-                # Process domain in args[0]
-                domain = normalized_args[0]
-                domain_list = []
+        args = normalize_search_args(method, args)
 
-                # Check if domain is wrapped unnecessarily ([domain] instead of domain)
-                if (
-                    isinstance(domain, list)
-                    and len(domain) == 1
-                    and isinstance(domain[0], list)
-                ):
-                    # Case [[domain]] - unwrap to [domain]
-                    domain = domain[0]
-
-                # Normalize domain similar to search_records function
-                if domain is None:
-                    domain_list = []
-                elif isinstance(domain, dict):
-                    if "conditions" in domain:
-                        # Object format
-                        conditions = domain.get("conditions", [])
-                        domain_list = []
-                        for cond in conditions:
-                            if isinstance(cond, dict) and all(
-                                k in cond for k in ["field", "operator", "value"]
-                            ):
-                                domain_list.append(
-                                    [cond["field"], cond["operator"], cond["value"]]
-                                )
-                elif isinstance(domain, list):
-                    # List format
-                    if not domain:
-                        domain_list = []
-                    elif all(isinstance(item, list) for item in domain) or any(
-                        item in ["&", "|", "!"] for item in domain
-                    ):
-                        domain_list = domain
-                    elif len(domain) >= 3 and isinstance(domain[0], str):
-                        # Case [field, operator, value] (not [[field, operator, value]])
-                        domain_list = [domain]
-                elif isinstance(domain, str):
-                    # String format (JSON)
-                    try:
-                        parsed_domain = json.loads(domain)
-                        if (
-                            isinstance(parsed_domain, dict)
-                            and "conditions" in parsed_domain
-                        ):
-                            conditions = parsed_domain.get("conditions", [])
-                            domain_list = []
-                            for cond in conditions:
-                                if isinstance(cond, dict) and all(
-                                    k in cond for k in ["field", "operator", "value"]
-                                ):
-                                    domain_list.append(
-                                        [cond["field"], cond["operator"], cond["value"]]
-                                    )
-                        elif isinstance(parsed_domain, list):
-                            domain_list = parsed_domain
-                    except json.JSONDecodeError:
-                        try:
-                            import ast
-
-                            # noqa: S307 - Used safely with literal only
-                            parsed_domain = ast.literal_eval(domain)
-                            if isinstance(parsed_domain, list):
-                                domain_list = parsed_domain
-                        except (ValueError, SyntaxError):
-                            domain_list = []
-
-                # Validate domain_list
-                if domain_list:
-                    valid_conditions = []
-                    for cond in domain_list:
-                        if isinstance(cond, str) and cond in ["&", "|", "!"]:
-                            valid_conditions.append(cond)
-                            continue
-
-                        if (
-                            isinstance(cond, list)
-                            and len(cond) == 3
-                            and isinstance(cond[0], str)
-                            and isinstance(cond[1], str)
-                        ):
-                            valid_conditions.append(cond)
-
-                    domain_list = valid_conditions
-
-                # Update args with normalized domain
-                normalized_args[0] = domain_list
-                args = normalized_args
-
-                # Log for debugging
-                print(f"Executing {method} with normalized domain: {domain_list}")
+        max_rows, max_bytes = pagination.get_budget()
+        if method == "search_read" and (max_rows or max_bytes):
+            query = pagination.build_query(odoo, model, args, kwargs)
+            return _page_response(odoo, query, max_rows, max_bytes)
 
         result = odoo.execute_method(model, method, *args, **kwargs)
         return {"success": True, "result": result}
@@ -399,7 +532,600 @@ def execute_method(
         return {"success": False, "error": str(e)}
 
 
+def _page_response(
+    odoo: OdooClient, query: Dict[str, Any], max_rows: int, max_bytes: int
+) -> Dict[str, Any]:
+    """Read one page of a query and add the cursor of the next one"""
+    records, next_cursor = pagination.fetch_page(odoo, query, max_rows, max_bytes)
+    response = {"success": True, "result": records}
+    if next_cursor is not None:
+        response["next_cursor"] = next_cursor
+        response["message"] = (
+            f"Result truncated to {len(records)} records to stay within the "
+            "response budget; call continue_query with next_cursor for more"
+        )
+    return response
+
+
+@mcp.tool(description="Read the next page of a truncated search_read result")
+@offload
+def continue_query(ctx: Context, cursor: str) -> Dict[str, Any]:
+    """
+    Resume a search_read that went over the response budget
+
+    Parameters:
+        cursor: The next_cursor returned by execute_method or a previous
+            continue_query call
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: Next page of records (if success)
+        - next_cursor: Cursor of the following page, absent on the last one
+        - error: Error message (if failure)
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        query = pagination.decode_cursor(cursor)
+        return _page_response(odoo, query, *pagination.get_budget())
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def _find_refs(value: Any) -> set:
+    """Collect the operation indexes referenced with {"$ref": index}"""
+    if isinstance(value, dict):
+        if set(value) == {"$ref"}:
+            return {value["$ref"]}
+        return set().union(*(_find_refs(v) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_find_refs(v) for v in value))
+    return set()
+
+
+def _resolve_refs(value: Any, results: List[Any]) -> Any:
+    """Replace {"$ref": index} placeholders with earlier operation results"""
+    if isinstance(value, dict):
+        if set(value) == {"$ref"}:
+            return results[value["$ref"]]
+        return {k: _resolve_refs(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(v, results) for v in value]
+    return value
+
+
+@mcp.tool(description="Execute several Odoo methods in one call")
+@offload
+def batch_execute(
+    ctx: Context,
+    operations: List[BatchOperation],
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """
+    Execute several methods, running independent operations concurrently
+
+    An argument may reference the result of an earlier operation with
+    {"$ref": index}, e.g. the id returned by a create. Operations run as
+    soon as the operations they reference have succeeded.
+
+    Parameters:
+        operations: List of {model, method, args, kwargs} operations
+        max_concurrency: Maximum number of operations running at once,
+            capped at the client's worker count (ODOO_MAX_WORKERS)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating that every operation succeeded
+        - results: One {success, result | error} entry per operation, in order
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "results": [],
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    deps = []
+    for index, op in enumerate(operations):
+        refs = _find_refs([op.args, op.kwargs])
+        invalid = [ref for ref in refs if not isinstance(ref, int) or ref >= index]
+        if invalid:
+            return {
+                "success": False,
+                "results": [],
+                "error": f"Operation {index} references invalid operations: {invalid}",
+            }
+        deps.append(refs)
+
+    values: List[Any] = [None] * len(operations)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(operations)
+
+    def run(index: int) -> Any:
+        op = operations[index]
+        args = _resolve_refs(op.args, values)
+        kwargs = _resolve_refs(op.kwargs, values)
+        args = normalize_search_args(op.method, args)
+        return odoo.execute_method(op.model, op.method, *args, **kwargs)
+
+    pending = set(range(len(operations)))
+    workers = max(1, min(max_concurrency, odoo.max_workers))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running: Dict[Any, int] = {}
+        while pending or running:
+            for index in sorted(pending):
+                if any(results[dep] is None for dep in deps[index]):
+                    continue
+                pending.discard(index)
+                failed = [dep for dep in deps[index] if not results[dep]["success"]]
+                if failed:
+                    results[index] = {
+                        "success": False,
+                        "error": f"Referenced operations failed: {failed}",
+                    }
+                else:
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, run, index)] = index
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    values[index] = future.result()
+                    results[index] = {"success": True, "result": values[index]}
+                except Exception as e:
+                    results[index] = {"success": False, "error": str(e)}
+
+    return {
+        "success": all(result["success"] for result in results),
+        "results": results,
+    }
+
+
+@mcp.tool(description="Search records and read their fields, expanding relations")
+@offload(priority=INTERACTIVE)
+def search_records(
+    ctx: Context,
+    model: str,
+    domain: Any = None,
+    fields: Union[List[str], str, None] = None,
+    limit: int = 100,
+    offset: int = 0,
+    order: Optional[str] = None,
+    expand: Optional[Dict[str, Any]] = None,
+    load: Optional[str] = "_classic_read",
+    display_names: Optional[List[str]] = None,
+    format: str = "records",
+    flatten_many2one: bool = False,
+) -> Dict[str, Any]:
+    """
+    Search records and read their fields in a single call
+
+    Parameters:
+        model: The model name (e.g., 'sale.order')
+        domain: Search domain in any format accepted by execute_method
+        fields: Field names to return. When omitted, stored scalar and
+            many2one fields are returned; pass "*" for every field
+        limit: Maximum number of records to return
+        offset: Number of records to skip
+        order: Sorting criteria (e.g., 'name ASC, id DESC')
+        expand: Relational fields to replace by their related records,
+            e.g. {"partner_id": ["name", "email"], "order_line":
+            {"fields": ["product_id"], "expand": {"product_id": ["name"]}}}.
+            Related records are read in one batch per model.
+        load: null to return many2one values as plain IDs instead of
+            [id, display_name], which is much cheaper on large models
+        display_names: many2one fields to turn back into [id, display_name]
+            after a load=null read; names are read in one batched, cached
+            call per related model
+        format: "records" for a list of objects, or "columnar" for
+            {"fields": [...], "rows": [[...], ...]}, which names each field
+            once and is much smaller on wide results
+        flatten_many2one: With the columnar format, split [id, name] values
+            into a "field" ID column and a "field.display_name" column
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: List of records, or the columnar object (if success)
+        - error: Error message (if failure)
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        # search_read adds the expanded fields to the projection, including
+        # the x2many fields the default projection leaves out
+        records = odoo.search_read(
+            model,
+            normalize_domain(domain),
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            order=order,
+            expand=expand,
+            load=load,
+        )
+        if display_names:
+            records = odoo.resolve_display_names(model, records, display_names)
+        columns = None
+        if isinstance(fields, list):
+            columns = list(fields) + [n for n in expand or {} if n not in fields]
+        result = serialization.shape_records(records, format, columns, flatten_many2one)
+        return {"success": True, "result": result}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def _count_tool(model: str, domain: Any, domains: Optional[List[Any]], kind: str):
+    """Shared implementation of count_records and exists"""
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    many = domains is not None
+    normalized = [normalize_domain(d) for d in (domains if many else [domain])]
+    count = odoo.count_records if kind == "count" else odoo.exists
+    try:
+        results = count(model, normalized)
+    except OdooBatchError as e:
+        return {
+            "success": False,
+            "result": e.results if many else None,
+            "failed": e.failures,
+            "error": str(e),
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    return {"success": True, "result": results if many else results[0]}
+
+
+@mcp.tool(description="Count records matching one or several domains")
+@offload(priority=INTERACTIVE)
+def count_records(
+    ctx: Context,
+    model: str,
+    domain: Any = None,
+    domains: Optional[List[Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Count matching records without transferring them
+
+    Parameters:
+        model: The model name (e.g., 'account.move')
+        domain: Search domain in any format accepted by execute_method
+        domains: Several domains to count in one call (overrides domain)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: The count, or one count per entry of domains
+        - failed: Failed domains with their index and error (if any)
+        - error: Error message (if failure)
+    """
+    return _count_tool(model, domain, domains, "count")
+
+
+@mcp.tool(description="Check whether any record matches one or several domains")
+@offload(priority=INTERACTIVE)
+def exists(
+    ctx: Context,
+    model: str,
+    domain: Any = None,
+    domains: Optional[List[Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Check for matching records, stopping at the first match
+
+    Parameters:
+        model: The model name (e.g., 'account.move')
+        domain: Search domain in any format accepted by execute_method
+        domains: Several domains to check in one call (overrides domain)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: True/False, or one boolean per entry of domains
+        - failed: Failed domains with their index and error (if any)
+        - error: Error message (if failure)
+    """
+    return _count_tool(model, domain, domains, "exists")
+
+
+@mcp.tool(description="Aggregate records on the Odoo server with read_group")
+@offload
+def aggregate_records(
+    ctx: Context,
+    model: str,
+    groupby: List[str],
+    aggregates: List[str],
+    domain: Any = None,
+    limit: Optional[int] = None,
+    orderby: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Group records and compute aggregates in the database
+
+    Parameters:
+        model: The model name (e.g., 'sale.order')
+        groupby: Fields to group by, with optional date granularity
+            (e.g., ['partner_id', 'date_order:quarter'])
+        aggregates: Aggregate specs (e.g., ['amount_total:sum',
+            'amount_untaxed:avg'])
+        domain: Search domain in any format accepted by execute_method
+        limit: Maximum number of groups to return
+        orderby: Sorting criteria for the groups (e.g., 'amount_total desc')
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: One row per group with group values, count and aggregates
+        - error: Error message (if failure)
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        groups = odoo.read_group(
+            model,
+            normalize_domain(domain),
+            aggregates,
+            groupby,
+            limit=limit,
+            orderby=orderby,
+        )
+        return {"success": True, "result": groups}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool(description="Create many records in concurrent chunks")
+@offload(priority=BULK)
+def bulk_create(
+    ctx: Context,
+    model: str,
+    vals_list: List[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Create many records with list-of-values create calls
+
+    Parameters:
+        model: The model name (e.g., 'res.partner')
+        vals_list: One values dictionary per record to create
+        chunk_size: Records per create call (optional)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating that every chunk succeeded
+        - ids: Created IDs
+        - failed: Failed chunks with offset, size and error
+        - remaining: Values of the failed chunks, to resubmit
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        return odoo.bulk_create(model, vals_list, chunk_size=chunk_size)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool(description="Update many records, grouping identical values")
+@offload(priority=BULK)
+def bulk_write(
+    ctx: Context,
+    model: str,
+    updates: List[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Update many records with one write call per group of identical values
+
+    Parameters:
+        model: The model name (e.g., 'res.partner')
+        updates: Entries like {"id": 7, "vals": {...}} or
+            {"ids": [7, 8], "vals": {...}}
+        chunk_size: IDs per write call (optional)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating that every write succeeded
+        - updated: Number of records written
+        - calls: Number of write calls issued
+        - failed: Failed {ids, vals, error} entries, to resubmit as updates
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        return odoo.bulk_write(model, updates, chunk_size=chunk_size)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool(description="Export matching records to a local NDJSON, CSV or Parquet file")
+@offload(priority=BULK)
+def export_records(
+    ctx: Context,
+    model: str,
+    domain: Any = None,
+    fields: Union[List[str], str, None] = None,
+    format: str = "ndjson",
+    filename: Optional[str] = None,
+    page_size: Optional[int] = None,
+    parallelism: int = 1,
+) -> Dict[str, Any]:
+    """
+    Stream every matching record to a file instead of returning the rows
+
+    Parameters:
+        model: The model name (e.g., 'account.move.line')
+        domain: Search domain in any format accepted by execute_method
+        fields: Field names to export. When omitted, stored scalar and
+            many2one fields are exported; pass "*" for every field
+        format: 'ndjson', 'csv' or 'parquet' (requires pyarrow)
+        filename: Optional file name inside ODOO_EXPORT_DIR
+        page_size: Records fetched per call to Odoo (adapted to observed
+            latency and payload size when omitted)
+        parallelism: Number of id-range shards fetched concurrently (rows
+            stay in id order)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: File path, format, row count, byte size and timings
+        - error: Error message (if failure)
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        result = export.export_records(
+            odoo,
+            model,
+            normalize_domain(domain),
+            fields=fields,
+            fmt=format,
+            filename=filename,
+            page_size=page_size,
+            parallelism=parallelism,
+        )
+        return {"success": True, "result": result}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool(description="Download an attachment to a local file")
+@offload
+def download_attachment(
+    ctx: Context,
+    attachment_id: int,
+    filename: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Stream an attachment's content to a file in ODOO_EXPORT_DIR
+
+    Parameters:
+        attachment_id: ID of the ir.attachment record
+        filename: Optional local file name (defaults to the attachment name)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: Local path, byte size, SHA-256 digest and checksum status
+        - error: Error message (if failure)
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        result = attachments.download_attachment(odoo, attachment_id, filename)
+        return {"success": True, "result": result}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool(description="Upload a local file as an attachment")
+@offload
+def upload_attachment(
+    ctx: Context,
+    filename: str,
+    name: Optional[str] = None,
+    res_model: Optional[str] = None,
+    res_id: Optional[int] = None,
+    mimetype: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create an attachment from a file in ODOO_EXPORT_DIR
+
+    The file is sent base64-encoded in a single XML-RPC create call and is
+    not streamed: the payload is held in memory, several times the file
+    size at peak, and must fit within the Odoo server's request limits.
+    Keep uploads to files of a few tens of megabytes.
+
+    Parameters:
+        filename: Name of the file inside ODOO_EXPORT_DIR
+        name: Attachment name (defaults to the file name)
+        res_model: Model of the record to attach to (e.g., 'res.partner')
+        res_id: ID of the record to attach to
+        mimetype: MIME type (guessed from the file name if omitted)
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - result: Attachment ID, byte size and SHA-256 digest
+        - error: Error message (if failure)
+    """
+    try:
+        odoo = get_or_create_odoo_client()
+    except ConnectionError as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Odoo connection failed: {str(e)}. Make sure Odoo is running.",
+        }
+
+    try:
+        result = attachments.upload_attachment(
+            odoo, filename, name, res_model, res_id, mimetype
+        )
+        return {"success": True, "result": result}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 @mcp.tool(description="Search for employees by name")
+@offload(priority=INTERACTIVE)
 def search_employee(
     ctx: Context,
     name: str,
@@ -432,15 +1158,16 @@ def search_employee(
 
     try:
         result = odoo.execute_method(model, method, *args, **kwargs)
-        parsed_result = [
-            EmployeeSearchResult(id=item[0], name=item[1]) for item in result
-        ]
+        parsed_result = _employee_results.validate_python(
+            [{"id": item[0], "name": item[1]} for item in result]
+        )
         return SearchEmployeeResponse(success=True, result=parsed_result)
     except Exception as e:
         return SearchEmployeeResponse(success=False, error=str(e))
 
 
 @mcp.tool(description="Search for holidays within a date range")
+@offload(priority=INTERACTIVE)
 def search_holidays(
     ctx: Context,
     start_date: str,
@@ -501,26 +1228,10 @@ def search_holidays(
 
     model = "hr.leave"
     method = "search_read"
-    fields = [
-        "employee_id",
-        "holiday_status_id",
-        "request_date_from",
-        "request_date_to",
-        "state",
-    ]
 
     try:
-        result = odoo.execute_method(model, method, [domain], {"fields": fields})
-        parsed_result = [
-            Holiday(
-                employee_name=item.get("employee_id", [None, ""])[1],
-                holiday_type=item.get("holiday_status_id", [None, ""])[1],
-                start_datetime=item.get("request_date_from", ""),
-                end_datetime=item.get("request_date_to", ""),
-                state=item.get("state", ""),
-            )
-            for item in result
-        ]
+        result = odoo.execute_method(model, method, domain, fields=HOLIDAY_FIELDS)
+        parsed_result = _holidays.validate_python(result)
         return SearchHolidaysResponse(success=True, result=parsed_result)
     except Exception as e:
         return SearchHolidaysResponse(success=False, error=str(e))
@@ -554,6 +1265,7 @@ class OdooServerResponse:
 
 
 @mcp.tool(description="Check Odoo server status and optionally start it")
+@offload
 def manage_odoo_server(
     ctx: Any,
     action: str = "status",
@@ -0,0 +1,177 @@
+"""
+Bounded thread pool for blocking tool and resource handlers
+
+Handlers do blocking XML-RPC calls. Running them on the event loop would
+stall the stdio server for every other request, so they are offloaded to a
+dedicated pool whose queue depth and wait times are tracked. Handlers
+waiting for a worker are dispatched by priority class, like the calls
+waiting for an admission limit, so bulk handlers cannot hold every worker
+ahead of interactive lookups.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from .admission import _WaitQueue, current_priority
+from .admission import priority as priority_class
+
+# Number of recent wait times kept for the metrics
+WAIT_SAMPLES = 1024
+
+
+class ToolPool:
+    """Thread pool running blocking handlers by priority, with queue metrics"""
+
+    def __init__(self, max_workers: int = 8) -> None:
+        """
+        Initialize the pool
+
+        Args:
+            max_workers: Maximum number of handlers running at once
+        """
+        self.max_workers = max_workers
+        self._cond = threading.Condition()
+        self._queue = _WaitQueue()
+        self._jobs: dict[tuple[str, object], tuple[Future, Callable]] = {}
+        self._threads = 0
+        self._idle = 0
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._waits: deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    async def run(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run fn on the pool with the caller's context variables
+
+        The handler waits for a worker in the priority class of the caller
+        (see :func:`odoo_mcp.admission.priority`).
+        """
+        context = contextvars.copy_context()
+        submitted = time.monotonic()
+        future: Future = Future()
+
+        def call() -> Any:
+            with self._cond:
+                self._waits.append(time.monotonic() - submitted)
+            return context.run(fn, *args, **kwargs)
+
+        with self._cond:
+            ticket = self._queue.push(current_priority())
+            self._jobs[ticket] = (future, call)
+            self._queued += 1
+            if self._idle:
+                self._idle -= 1
+                self._cond.notify()
+            elif self._threads < self.max_workers:
+                self._threads += 1
+                threading.Thread(
+                    target=self._work,
+                    name=f"odoo-mcp-tool_{self._threads}",
+                    daemon=True,
+                ).start()
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            with self._cond:
+                if self._jobs.pop(ticket, None) is not None:
+                    # Never started
+                    self._queue.remove(ticket)
+                    self._queued -= 1
+            raise
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    # Decremented by the caller that wakes this worker up
+                    self._idle += 1
+                    self._cond.wait()
+                ticket = self._queue.head()
+                self._queue.dispatch(ticket)
+                future, call = self._jobs.pop(ticket)
+                self._queued -= 1
+                self._running += 1
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(call())
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._completed += 1
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, running handlers and recent wait times"""
+        with self._cond:
+            waits = sorted(self._waits)
+            queued, running, completed = self._queued, self._running, self._completed
+        wait_stats = {"samples": len(waits)}
+        if waits:
+            wait_stats.update(
+                {
+                    "avg": round(sum(waits) / len(waits), 4),
+                    "p95": round(waits[int(0.95 * (len(waits) - 1))], 4),
+                    "max": round(waits[-1], 4),
+                }
+            )
+        return {
+            "max_workers": self.max_workers,
+            "queued": queued,
+            "running": running,
+            "completed": completed,
+            "wait_seconds": wait_stats,
+        }
+
+
+_pool: Optional[ToolPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_tool_pool() -> ToolPool:
+    """Return the shared pool, sized by ODOO_TOOL_WORKERS"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ToolPool(int(os.environ.get("ODOO_TOOL_WORKERS", "8")))
+        return _pool
+
+
+def offload(fn: Optional[Callable] = None, *, priority: Optional[str] = None):
+    """
+    Turn a blocking handler into a coroutine running on the tool pool
+
+    The signature is preserved, so FastMCP derives the same schema and
+    still injects the Context argument.
+
+    Args:
+        fn: Handler to wrap
+        priority: Priority class ('interactive', 'normal' or 'bulk') of the
+            Odoo calls the handler makes (normal by default)
+
+    Examples:
+        >>> @mcp.tool()
+        ... @offload(priority=BULK)
+        ... def export_records(ctx: Context, model: str) -> dict: ...
+    """
+    if fn is None:
+        return functools.partial(offload, priority=priority)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if priority is None:
+            return await get_tool_pool().run(fn, *args, **kwargs)
+        # The pool queues the handler in this class and runs it with it
+        with priority_class(priority):
+            return await get_tool_pool().run(fn, *args, **kwargs)
+
+    return wrapper
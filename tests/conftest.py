@@ -0,0 +1,42 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_odoo import PASSWORD, FakeOdoo  # noqa: E402
+
+from odoo_mcp.odoo_client import OdooClient  # noqa: E402
+
+
+@pytest.fixture
+def fake_odoo():
+    server = FakeOdoo().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_client(fake_odoo):
+    """Build OdooClients connected to the fake server"""
+
+    def make(**kwargs):
+        return OdooClient(fake_odoo.url, "test", "admin", PASSWORD, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def call_tool(monkeypatch):
+    """Call an MCP tool with the given client as the server's Odoo client"""
+    from odoo_mcp import server
+
+    def call(client, name, **arguments):
+        monkeypatch.setattr(server, "_odoo_client_cache", client)
+        _content, structured = asyncio.run(server.mcp.call_tool(name, arguments))
+        return structured["result"]
+
+    return call
@@ -0,0 +1,317 @@
+"""
+In-process stand-in for an Odoo server
+
+Serves the XML-RPC endpoints the client uses, ``/web/session/authenticate``
+and ``/longpolling/poll`` on a local port. Models are plain dictionaries of
+records. Domains use Odoo's prefix notation and searches sort like
+PostgreSQL, with NULL (False) values last in ascending order and first in
+descending order; create, write and unlink do not check their values.
+"""
+
+import json
+import threading
+import time
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from xmlrpc.server import SimpleXMLRPCDispatcher
+
+UID = 2
+PASSWORD = "admin"
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a is not False and a > b,
+    ">=": lambda a, b: a is not False and a >= b,
+    "<": lambda a, b: a is not False and a < b,
+    "<=": lambda a, b: a is not False and a <= b,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+    "ilike": lambda a, b: str(b).lower() in str(a).lower(),
+}
+
+
+def _value(record: dict, name: str) -> Any:
+    value = record.get(name, False)
+    if isinstance(value, list) and len(value) == 2 and isinstance(value[1], str):
+        # many2one
+        return value[0]
+    return value
+
+
+def _matches(record: dict, domain: list) -> bool:
+    """Evaluate a prefix-notation domain; top-level terms are ANDed"""
+    stack: list[bool] = []
+    for term in reversed(domain):
+        if term == "!":
+            stack.append(not stack.pop())
+        elif term in ("&", "|"):
+            first, second = stack.pop(), stack.pop()
+            stack.append(first and second if term == "&" else first or second)
+        else:
+            name, operator, value = term
+            stack.append(_OPERATORS[operator](_value(record, name), value))
+    return all(stack)
+
+
+def _sort(records: list[dict], order: Optional[str]) -> list[dict]:
+    """Sort records by an order clause, then by id"""
+    terms = [term.split() for term in (order or "").split(",") if term.strip()]
+    records = sorted(records, key=lambda r: r.get("id", 0))
+    for term in reversed(terms):
+        name, desc = term[0], len(term) > 1 and term[1].lower() == "desc"
+
+        def key(record: dict, name: str = name) -> tuple:
+            value = _value(record, name)
+            null = value is False or value is None
+            return (null, 0 if null else value)
+
+        records.sort(key=key, reverse=desc)
+    return records
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for bursts of new connections from concurrent clients
+    request_queue_size = 512
+
+
+class FakeOdoo:
+    """
+    Fake Odoo server with injectable latency, failures and bus notifications
+
+    Attributes:
+        records: Model name -> record ID -> record
+        latency: Seconds a call takes, given (model, method, args, kwargs)
+        fail: Whether a call fails with an Odoo fault, given the same
+        notifications: Bus notifications returned by long-polling requests
+        poll_failures: Number of upcoming polls answered with an HTTP error
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[str, dict[int, dict]] = {}
+        self.fields: dict[str, dict[str, dict]] = {}
+        self.latency: Optional[Callable[[str, str, list, dict], float]] = None
+        self.fail: Optional[Callable[[str, str, list, dict], bool]] = None
+        self.notifications: list[dict] = []
+        self.poll_failures = 0
+        self.calls: list[tuple[str, str, list, dict]] = []
+        self.inflight = 0
+        self.max_inflight = 0
+        self._lock = threading.Lock()
+
+        common = SimpleXMLRPCDispatcher(allow_none=True)
+        common.register_function(self.authenticate, "authenticate")
+        common.register_function(lambda: {"server_version": "15.0"}, "version")
+        obj = SimpleXMLRPCDispatcher(allow_none=True)
+        obj.register_function(self.execute_kw, "execute_kw")
+        self._dispatchers = {"/xmlrpc/2/common": common, "/xmlrpc/2/object": obj}
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "FakeOdoo":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def authenticate(self, db: str, login: str, password: str, context: dict):
+        return UID if password == PASSWORD else False
+
+    def execute_kw(
+        self,
+        db: str,
+        uid: int,
+        password: str,
+        model: str,
+        method: str,
+        args: list,
+        kwargs: Optional[dict] = None,
+    ) -> Any:
+        kwargs = kwargs or {}
+        with self._lock:
+            self.calls.append((model, method, args, kwargs))
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            if self.latency is not None:
+                time.sleep(self.latency(model, method, args, kwargs))
+            if self.fail is not None and self.fail(model, method, args, kwargs):
+                raise xmlrpc.client.Fault(2, f"Injected failure in {method}")
+            return self._call(model, method, args, kwargs)
+        finally:
+            with self._lock:
+                self.inflight -= 1
+
+    def _call(self, model: str, method: str, args: list, kwargs: dict) -> Any:
+        records = self.records.setdefault(model, {})
+        if method == "fields_get":
+            return self.fields.get(model, {})
+        if method == "read":
+            fields = args[1] if len(args) > 1 else kwargs.get("fields")
+            if isinstance(fields, dict):
+                raise xmlrpc.client.Fault(2, "Invalid field 'fields'")
+            load = kwargs.get("load", "_classic_read")
+            return [
+                self._project(records[i], fields, load) for i in args[0] if i in records
+            ]
+        if method in ("search", "search_read", "search_count"):
+            domain = args[0] if args else kwargs.get("domain", [])
+            found = [r for r in records.values() if _matches(r, domain)]
+            found = _sort(found, kwargs.get("order"))
+            if method == "search_count":
+                return len(found)
+            offset = kwargs.get("offset") or 0
+            limit = kwargs.get("limit")
+            found = found[offset:][:limit] if limit else found[offset:]
+            if method == "search":
+                return [r["id"] for r in found]
+            load = kwargs.get("load", "_classic_read")
+            return [self._project(r, kwargs.get("fields"), load) for r in found]
+        if method == "read_group":
+            return self._read_group(records, *args, **kwargs)
+        if method in ("create", "write", "unlink"):
+            with self._lock:
+                return self._mutate(records, method, args)
+        raise xmlrpc.client.Fault(1, f"Unknown method {model}.{method}")
+
+    @staticmethod
+    def _mutate(records: dict, method: str, args: list) -> Any:
+        """Create, write or unlink records; called with the lock held"""
+        if method == "create":
+            many = isinstance(args[0], list)
+            created = []
+            for vals in args[0] if many else [args[0]]:
+                record_id = max(records, default=0) + 1
+                records[record_id] = dict(vals, id=record_id)
+                created.append(record_id)
+            return created if many else created[0]
+        if method == "write":
+            for record_id in args[0]:
+                records[record_id].update(args[1])
+            return True
+        for record_id in args[0]:
+            records.pop(record_id, None)
+        return True
+
+    @staticmethod
+    def _read_group(
+        records: dict,
+        domain: list,
+        aggregates: list,
+        groupby: list,
+        lazy: bool = True,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        orderby: Optional[str] = None,
+    ) -> list[dict]:
+        """Group on plain fields; aggregates are 'field:func' or 'name:func(field)'"""
+        groups: dict[tuple, list[dict]] = {}
+        for record in _sort([r for r in records.values() if _matches(r, domain)], None):
+            key = tuple(_value(record, name) for name in groupby)
+            groups.setdefault(key, []).append(record)
+        functions = {"sum": sum, "min": min, "max": max, "count": len}
+        functions["avg"] = lambda values: sum(values) / len(values)
+        result = []
+        for key, members in groups.items():
+            group: dict[str, Any] = {}
+            for name, value in zip(groupby, key):
+                sample = members[0].get(name)
+                group[name] = sample if isinstance(sample, list) else value
+            group["__count"] = len(members)
+            for spec in aggregates:
+                name, _, function = spec.partition(":")
+                function, _, source = function.rstrip(")").partition("(")
+                values = [m.get(source or name) or 0 for m in members]
+                group[name] = functions[function or "sum"](values)
+            group["__domain"] = domain + [[n, "=", v] for n, v in zip(groupby, key)]
+            result.append(group)
+        start = offset or 0
+        end = start + limit if limit else None
+        return _sort(result, orderby)[start:end]
+
+    @staticmethod
+    def _project(record: dict, fields: Optional[list], load: Optional[str]) -> dict:
+        result = {k: v for k, v in record.items() if not fields or k in fields}
+        result["id"] = record["id"]
+        if load != "_classic_read":
+            for name, value in result.items():
+                if isinstance(value, list) and len(value) == 2:
+                    result[name] = value[0]
+        return result
+
+    def poll(self, params: dict) -> list[dict]:
+        """Answer a long-polling request with the notifications after last"""
+        last = params.get("last") or 0
+        channels = params.get("channels") or []
+        deadline = time.monotonic() + 0.2
+        while True:
+            found = [
+                n
+                for n in self.notifications
+                if n["id"] > last and n["channel"] in channels
+            ]
+            if found or time.monotonic() > deadline:
+                return found
+            time.sleep(0.01)
+
+    def notify(self, channel: str, message: Any) -> None:
+        """Publish a bus notification"""
+        with self._lock:
+            self.notifications.append(
+                {
+                    "id": len(self.notifications) + 1,
+                    "channel": channel,
+                    "message": message,
+                }
+            )
+
+    def _handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                headers = {}
+                if self.path in fake._dispatchers:
+                    status = 200
+                    payload = fake._dispatchers[self.path]._marshaled_dispatch(body)
+                    content_type = "text/xml"
+                elif self.path == "/web/session/authenticate":
+                    params = json.loads(body)["params"]
+                    ok = params.get("password") == PASSWORD
+                    status = 200
+                    payload = json.dumps(
+                        {"result": {"uid": UID}} if ok else {"error": "Access denied"}
+                    ).encode()
+                    content_type = "application/json"
+                    headers["Set-Cookie"] = "session_id=fake; Path=/"
+                elif self.path == "/longpolling/poll":
+                    with fake._lock:
+                        failing = fake.poll_failures > 0
+                        fake.poll_failures -= failing
+                    if failing:
+                        status, payload = 502, b"Bad Gateway"
+                    else:
+                        result = fake.poll(json.loads(body)["params"])
+                        status, payload = 200, json.dumps({"result": result}).encode()
+                    content_type = "application/json"
+                else:
+                    status, payload, content_type = 404, b"Not Found", "text/plain"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
@@ -0,0 +1,57 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo_mcp.admission import AdaptiveLimiter, AdmissionController
+
+
+def run_for(seconds, threads, call):
+    deadline = time.monotonic() + seconds
+
+    def worker(index):
+        count = 0
+        while time.monotonic() < deadline:
+            call(index, count)
+            count += 1
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+
+
+def adaptive_client(make_client):
+    limiter = AdaptiveLimiter(initial=8)
+    client = make_client(admission=AdmissionController(adaptive=limiter))
+    return client, limiter
+
+
+def test_mixed_call_sizes_keep_the_limit(fake_odoo, make_client):
+    fake_odoo.records["res.partner"] = {i: {"id": i} for i in range(1, 6)}
+    # Lookups take 5 ms and pages of 500 records 200 ms, whatever the load;
+    # few records are served so the in-process server stays idle
+    fake_odoo.latency = lambda m, method, a, kw: (
+        0.2 if kw.get("limit") == 500 else 0.005
+    )
+    client, limiter = adaptive_client(make_client)
+
+    def call(index, count):
+        limit = 500 if index % 2 == 0 else 1
+        client.execute_method("res.partner", "search_read", [], limit=limit)
+
+    run_for(2, 4, call)
+
+    # A single key per model and method drove the limit down to 1
+    assert limiter.snapshot()["limit"] >= 4
+
+
+def test_latency_growing_with_load_lowers_the_limit(fake_odoo, make_client):
+    fake_odoo.records["res.partner"] = {1: {"id": 1}}
+    # Odoo with 2 workers: calls beyond that queue on the server
+    fake_odoo.latency = lambda *_: 0.01 * max(1, fake_odoo.inflight / 2)
+    client, limiter = adaptive_client(make_client)
+
+    def call(index, count):
+        client.execute_method("res.partner", "read", [1], ["id"])
+
+    run_for(1, 16, call)
+
+    assert limiter.decreases > 0
+    assert limiter.snapshot()["limit"] <= 8
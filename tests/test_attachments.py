@@ -0,0 +1,33 @@
+import hashlib
+import os
+
+from odoo_mcp import attachments
+
+
+def test_upload_and_xmlrpc_download_round_trip(
+    fake_odoo, make_client, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("ODOO_EXPORT_DIR", str(tmp_path))
+    # Several download slices, the last one partial
+    content = os.urandom(2 * attachments.CHUNK_SIZE + 1000)
+    (tmp_path / "report.bin").write_bytes(content)
+    client = make_client()
+
+    uploaded = attachments.upload_attachment(
+        client, "report.bin", res_model="res.partner", res_id=7
+    )
+    assert uploaded["bytes"] == len(content)
+    assert uploaded["sha256"] == hashlib.sha256(content).hexdigest()
+    record = fake_odoo.records["ir.attachment"][uploaded["id"]]
+    assert (record["res_model"], record["res_id"]) == ("res.partner", 7)
+    assert record["mimetype"] == "application/octet-stream"
+    record["checksum"] = hashlib.sha1(content).hexdigest()
+
+    # The fake serves no /web/content, so the download falls back to XML-RPC
+    downloaded = attachments.download_attachment(client, uploaded["id"], "copy.bin")
+
+    assert downloaded["transport"] == "xmlrpc"
+    assert downloaded["verified"] is True
+    assert downloaded["bytes"] == len(content)
+    assert downloaded["sha256"] == uploaded["sha256"]
+    assert (tmp_path / "copy.bin").read_bytes() == content
@@ -0,0 +1,100 @@
+import time
+
+from odoo_mcp.bus import WEBSOCKET, BusListener
+from odoo_mcp.cache import OdooCache
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def seed(cache):
+    cache.set_fields("res.partner", {"name": {"type": "char"}})
+    cache.set_records("res.partner", [{"id": 1}, {"id": 2}], "k")
+    cache.set_query("res.partner", "count", 2)
+
+
+def start_listener(client, cache, channels):
+    listener = BusListener(client, cache, channels, poll_timeout=1, retry_delay=0.05)
+    listener.start()
+    return listener
+
+
+def test_longpolling_notifications_evict_records(fake_odoo, make_client):
+    cache = OdooCache()
+    seed(cache)
+    listener = start_listener(make_client(), cache, {"mcp_cache": None})
+    try:
+        fake_odoo.notify(
+            "mcp_cache",
+            {"type": "mcp_cache", "payload": {"model": "res.partner", "ids": [1]}},
+        )
+        wait_for(lambda: listener.last == 1)
+    finally:
+        listener.stop()
+
+    found, missing = cache.get_records("res.partner", [1, 2], "k")
+    assert list(found) == [2] and missing == [1]
+    assert cache.get_query("res.partner", "count") is None
+    assert cache.get_fields("res.partner") is not None
+
+
+def test_channel_binding_evicts_whole_model(fake_odoo, make_client):
+    cache = OdooCache()
+    seed(cache)
+    listener = start_listener(make_client(), cache, {"partners": "res.partner"})
+    try:
+        fake_odoo.notify("partners", {})
+        wait_for(lambda: listener.last == 1)
+    finally:
+        listener.stop()
+
+    assert cache.get_records("res.partner", [1, 2], "k")[1] == [1, 2]
+
+
+def test_data_is_cleared_after_reconnecting(fake_odoo, make_client):
+    cache = OdooCache()
+    fake_odoo.poll_failures = 3
+    listener = start_listener(make_client(), cache, {"mcp_cache": None})
+    try:
+        # Entries written while the listener is disconnected
+        wait_for(lambda: fake_odoo.poll_failures == 1)
+        seed(cache)
+        assert cache.get_query("res.partner", "count") == 2
+        wait_for(lambda: cache.get_query("res.partner", "count") is None)
+    finally:
+        listener.stop()
+
+    assert cache.get_records("res.partner", [1, 2], "k")[1] == [1, 2]
+    assert cache.get_query("res.partner", "count") is None
+    assert cache.get_fields("res.partner") is not None
+
+
+def test_errors_alone_do_not_clear_the_cache(fake_odoo, make_client):
+    cache = OdooCache()
+    seed(cache)
+    fake_odoo.poll_failures = 1000
+    listener = start_listener(make_client(), cache, {"mcp_cache": None})
+    try:
+        wait_for(lambda: fake_odoo.poll_failures < 995)
+    finally:
+        listener.stop()
+
+    assert cache.get_query("res.partner", "count") == 2
+
+
+def test_websocket_notifications_use_the_type_as_channel(fake_odoo, make_client):
+    cache = OdooCache()
+    seed(cache)
+    listener = BusListener(
+        make_client(), cache, {"partners": "res.partner"}, mode=WEBSOCKET
+    )
+    listener.handle_notification(
+        {"id": 7, "message": {"type": "partners", "payload": {"id": 2}}}
+    )
+
+    assert listener.last == 7
+    assert cache.get_records("res.partner", [1, 2], "k")[1] == [2]
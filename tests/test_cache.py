@@ -0,0 +1,70 @@
+import time
+
+from odoo_mcp.cache import MemoryBackend, OdooCache
+
+
+def test_memory_backend_removes_expired_entries():
+    backend = MemoryBackend()
+    backend.set_many([("record:a:1", "k", 1), ("record:a:2", "k", 2)], ttl=0.01)
+    backend.set("record:a:3", "k", 3, ttl=60)
+    time.sleep(0.02)
+    backend.set("schema:a", "fields", {})
+
+    assert len(backend) == 2
+    assert backend.get("record:a:1", "k") is None
+    assert backend.get("record:a:3", "k") == 3
+
+
+def test_full_memory_backend_evicts_least_recently_used_entries():
+    backend = MemoryBackend(max_entries=3)
+    backend.set_many([("query:a", "x", 1), ("query:a", "y", 2), ("query:b", "z", 3)])
+    assert backend.get("query:a", "x") == 1
+
+    backend.set("query:c", "w", 4)
+
+    # Only the least recently used entry goes, not its whole namespace
+    assert len(backend) == 3
+    assert backend.get_many(
+        [("query:a", "x"), ("query:a", "y"), ("query:b", "z"), ("query:c", "w")]
+    ) == [1, None, 3, 4]
+
+
+def test_full_memory_backend_inserts_stay_cheap():
+    backend = MemoryBackend(max_entries=20_000)
+    backend.set_many([(f"record:a:{i}", "k", i) for i in range(20_000)], ttl=300)
+
+    started = time.perf_counter()
+    for i in range(20_000, 40_000):
+        backend.set(f"record:a:{i}", "k", i, ttl=300)
+    elapsed = time.perf_counter() - started
+
+    assert len(backend) == 20_000
+    assert backend.get("record:a:19999", "k") is None
+    assert backend.get("record:a:39999", "k") == 39_999
+    # A scan of the whole cache per insert took minutes
+    assert elapsed < 2
+
+
+def test_invalidation_of_a_full_memory_backend():
+    cache = OdooCache(backend=MemoryBackend(max_entries=10))
+    cache.set_records("res.partner", [{"id": i} for i in range(1, 21)], "k")
+
+    cache.invalidate_model("res.partner")
+
+    assert len(cache.backend) == 0
+    cache.set_records("res.partner", [{"id": 1}], "k")
+    assert cache.get_records("res.partner", [1], "k") == ({1: {"id": 1}}, [])
+
+
+def test_clear_data_keeps_schema_entries():
+    cache = OdooCache()
+    cache.set_fields("res.partner", {"name": {}})
+    cache.set_records("res.partner", [{"id": 1}], "k")
+    cache.set_query("res.partner", "count", 1)
+
+    cache.clear_data()
+
+    assert cache.get_fields("res.partner") == {"name": {}}
+    assert cache.get_records("res.partner", [1], "k") == ({}, [1])
+    assert cache.get_query("res.partner", "count") is None
+    assert len(cache.backend) == 1
@@ -0,0 +1,55 @@
+import csv
+import datetime
+import json
+
+import pytest
+
+from odoo_mcp import export, serialization
+
+
+@pytest.fixture
+def contacts(fake_odoo, tmp_path, monkeypatch):
+    monkeypatch.setenv("ODOO_EXPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("ODOO_JSON_PRETTY", "1")
+    fake_odoo.records["res.partner"] = {
+        1: {"id": 1, "name": "Zoë", "parent_id": False, "category_id": []},
+        2: {"id": 2, "name": "Łukasz", "parent_id": [1, "Zoë"], "category_id": [3]},
+    }
+    return fake_odoo
+
+
+def test_ndjson_export_uses_compact_serialization(contacts, make_client):
+    result = export.export_records(
+        make_client(), "res.partner", [], ["name", "parent_id"], "ndjson", "out.ndjson"
+    )
+
+    assert result["rows"] == 2
+    with open(result["path"], encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    # Compact, one record per line despite ODOO_JSON_PRETTY, non-ASCII kept
+    assert lines[1] == '{"name":"Łukasz","parent_id":[1,"Zoë"],"id":2}'
+    assert json.loads(lines[0]) == {"id": 1, "name": "Zoë", "parent_id": False}
+
+
+def test_csv_cells_are_encoded_like_tool_payloads(contacts, make_client):
+    result = export.export_records(
+        make_client(),
+        "res.partner",
+        [],
+        ["name", "parent_id", "category_id"],
+        "csv",
+        "out.csv",
+    )
+
+    with open(result["path"], encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[1] == {
+        "id": "2",
+        "name": "Łukasz",
+        "parent_id": '[1,"Zoë"]',
+        "category_id": "[3]",
+    }
+    when = datetime.datetime(2024, 5, 1, 12, 30)
+    assert export._cell({"at": when, "raw": b"\x00"}) == serialization.dumps(
+        {"at": when, "raw": b"\x00"}, pretty=False
+    )
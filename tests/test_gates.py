@@ -0,0 +1,132 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from odoo_mcp.admission import AdmissionController, OdooOverloadedError
+
+
+@pytest.fixture
+def partners(fake_odoo):
+    fake_odoo.records["res.partner"] = {1: {"id": 1, "name": "Alice"}}
+    fake_odoo.records["res.users"] = {1: {"id": 1, "name": "Admin"}}
+    return fake_odoo
+
+
+def run_concurrently(calls, workers=16):
+    """Run the calls at once; return (results, errors)"""
+    results, errors = [], []
+
+    def run(call):
+        try:
+            results.append(call())
+        except Exception as e:
+            errors.append(e)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run, calls))
+    return results, errors
+
+
+def test_concurrency_limit(partners, make_client):
+    partners.latency = lambda *_: 0.05
+    client = make_client(
+        admission=AdmissionController({"res.partner": {"concurrency": 2}})
+    )
+
+    results, errors = run_concurrently(
+        [lambda: client.execute_method("res.partner", "search", [])] * 10
+    )
+
+    assert errors == [] and len(results) == 10
+    assert partners.max_inflight == 2
+
+
+def test_rate_limit(partners, make_client):
+    client = make_client(
+        admission=AdmissionController({":search_count": {"rate": 20, "burst": 1}})
+    )
+
+    started = time.monotonic()
+    for _ in range(11):
+        client.execute_method("res.partner", "search_count", [])
+    elapsed = time.monotonic() - started
+
+    # The first call uses the burst, the other ten wait 50 ms each
+    assert elapsed >= 0.45
+    # Other methods are not limited
+    started = time.monotonic()
+    for _ in range(11):
+        client.execute_method("res.partner", "search", [])
+    assert time.monotonic() - started < 0.45
+
+
+def test_full_queue_refuses_calls(partners, make_client):
+    partners.latency = lambda *_: 0.2
+    admission = AdmissionController({"res.partner": {"concurrency": 1, "max_queue": 2}})
+    client = make_client(admission=admission)
+
+    results, errors = run_concurrently(
+        [lambda: client.execute_method("res.partner", "search", [])] * 6
+    )
+
+    assert len(results) == 3
+    assert len(errors) == 3
+    assert all(isinstance(e, OdooOverloadedError) for e in errors)
+    assert "already waiting for res.partner" in str(errors[0])
+    assert admission.snapshot()["limits"]["res.partner"]["rejected"] == 3
+
+
+def test_waiting_too_long_refuses_calls(partners, make_client):
+    partners.latency = lambda *_: 0.3
+    client = make_client(
+        admission=AdmissionController({"res.partner": {"concurrency": 1}}, timeout=0.1)
+    )
+
+    results, errors = run_concurrently(
+        [lambda: client.execute_method("res.partner", "search", [])] * 2
+    )
+
+    assert len(results) == 1
+    assert len(errors) == 1 and "timed out" in str(errors[0])
+
+
+def test_overlapping_gates_do_not_deadlock(partners, make_client):
+    inflight = {"res.partner": 0, "read": 0}
+    peaks = dict(inflight)
+    lock = threading.Lock()
+
+    def latency(model, method, args, kwargs):
+        keys = [k for k in (model, method) if k in inflight]
+        with lock:
+            for key in keys:
+                inflight[key] += 1
+                peaks[key] = max(peaks[key], inflight[key])
+        time.sleep(0.005)
+        with lock:
+            for key in keys:
+                inflight[key] -= 1
+        return 0
+
+    partners.latency = latency
+    client = make_client(
+        admission=AdmissionController(
+            {
+                "res.partner": {"concurrency": 1, "max_queue": 100},
+                ":read": {"concurrency": 1, "max_queue": 100},
+                "res.partner:read": {"concurrency": 1, "max_queue": 100},
+            },
+            timeout=10,
+        )
+    )
+    calls = [
+        lambda: client.execute_method("res.partner", "read", [1], ["name"]),
+        lambda: client.execute_method("res.users", "read", [1], ["name"]),
+        lambda: client.execute_method("res.partner", "search", []),
+    ] * 20
+
+    results, errors = run_concurrently(calls)
+
+    assert errors == [] and len(results) == 60
+    assert peaks == {"res.partner": 1, "read": 1}
@@ -0,0 +1,295 @@
+import pytest
+
+from odoo_mcp.cache import OdooCache
+from odoo_mcp.odoo_client import OdooBatchError
+
+
+@pytest.fixture
+def partners(fake_odoo):
+    fake_odoo.records["res.partner"] = {
+        1: {"id": 1, "name": "Company", "parent_id": False},
+        2: {"id": 2, "name": "Alice", "parent_id": [1, "Company"]},
+        3: {"id": 3, "name": "Bob", "parent_id": [1, "Company"]},
+    }
+    return fake_odoo
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1])
+def test_read_options_are_sent_as_keywords(partners, make_client, chunk_size):
+    client = make_client()
+
+    records = client.read_records(
+        "res.partner", [2, 3], ["parent_id"], chunk_size=chunk_size, load=None
+    )
+
+    assert records == [{"id": 2, "parent_id": 1}, {"id": 3, "parent_id": 1}]
+    reads = [call for call in partners.calls if call[1] == "read"]
+    assert reads
+    for _model, _method, args, kwargs in reads:
+        assert len(args) == 1
+        assert kwargs == {"fields": ["parent_id"], "load": False}
+
+
+def test_classic_read_keeps_display_names(partners, make_client):
+    client = make_client()
+
+    records = client.read_records("res.partner", [2], ["parent_id"])
+
+    assert records == [{"id": 2, "parent_id": [1, "Company"]}]
+    assert partners.calls[-1][3] == {"fields": ["parent_id"]}
+
+
+@pytest.fixture
+def many_partners(fake_odoo):
+    fake_odoo.records["res.partner"] = {
+        i: {"id": i, "name": f"P{i}"} for i in range(1, 11)
+    }
+    return fake_odoo
+
+
+def test_chunked_read_keeps_the_input_order(many_partners, make_client):
+    # Earlier chunks answer last
+    many_partners.latency = lambda m, method, args, kw: 0.05 if 1 in args[0] else 0
+    client = make_client()
+
+    records = client.read_records("res.partner", [9, 1, 5, 2, 7, 3], ["name"], 2)
+
+    assert [record["id"] for record in records] == [9, 1, 5, 2, 7, 3]
+    assert len([call for call in many_partners.calls if call[1] == "read"]) == 3
+
+
+def test_chunked_read_reports_failed_chunks(many_partners, make_client):
+    many_partners.fail = lambda m, method, args, kw: method == "read" and 5 in args[0]
+    client = make_client(cache=OdooCache())
+
+    with pytest.raises(OdooBatchError) as info:
+        client.read_records("res.partner", list(range(1, 11)), ["name"], 3)
+
+    error = info.value
+    assert str(error).startswith("1 of 4 read chunks failed on res.partner: ")
+    assert "Injected failure in read" in str(error)
+    assert [failure["chunk"] for failure in error.failures] == [1]
+    assert error.failures[0]["ids"] == [4, 5, 6]
+    assert [r["id"] for r in error.results] == [1, 2, 3, 7, 8, 9, 10]
+
+    # The chunks that succeeded were cached, so a retry reads the rest only
+    many_partners.fail = None
+    many_partners.calls.clear()
+    records = client.read_records("res.partner", list(range(1, 11)), ["name"], 3)
+    assert [r["id"] for r in records] == list(range(1, 11))
+    assert [call[2][0] for call in many_partners.calls] == [[4, 5, 6]]
+
+
+@pytest.fixture
+def thirty_partners(fake_odoo):
+    fake_odoo.records["res.partner"] = {
+        i: {"id": i, "name": f"P{i}", "active": i % 4 != 0} for i in range(1, 31)
+    }
+    return fake_odoo
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_search_read_pages_by_id(thirty_partners, make_client, prefetch):
+    client = make_client()
+    domain = [["active", "=", True]]
+
+    records = list(
+        client.iter_search_read(
+            "res.partner", domain, ["name"], page_size=7, prefetch=prefetch
+        )
+    )
+
+    assert [r["id"] for r in records] == [i for i in range(1, 31) if i % 4]
+    pages = [call for call in thirty_partners.calls if call[1] == "search_read"]
+    # 23 records: three full pages and a short one, without offsets
+    assert len(pages) == 4
+    last_ids = [args[0][-1][2] for _m, _method, args, _kw in pages]
+    assert last_ids == [0, 9, 18, 27]
+    assert all(kw["limit"] == 7 and "offset" not in kw for *_, kw in pages)
+
+
+@pytest.fixture
+def orders(fake_odoo):
+    fake_odoo.fields["sale.order"] = {
+        "partner_id": {"type": "many2one", "relation": "res.partner"},
+        "order_line": {"type": "one2many", "relation": "sale.order.line"},
+    }
+    fake_odoo.fields["sale.order.line"] = {
+        "product_id": {"type": "many2one", "relation": "product.product"},
+    }
+    fake_odoo.records["res.partner"] = {
+        i: {"id": i, "name": f"P{i}"} for i in range(1, 6)
+    }
+    fake_odoo.records["product.product"] = {
+        i: {"id": i, "name": f"Product {i}"} for i in range(1, 4)
+    }
+    fake_odoo.records["sale.order.line"] = {
+        i: {"id": i, "product_id": [i % 3 + 1, f"Product {i % 3 + 1}"], "qty": i}
+        for i in range(1, 61)
+    }
+    fake_odoo.records["sale.order"] = {
+        i: {
+            "id": i,
+            "partner_id": [i % 5 + 1, f"P{i % 5 + 1}"] if i % 4 else False,
+            "order_line": [3 * i - 2, 3 * i - 1, 3 * i],
+        }
+        for i in range(1, 21)
+    }
+    return fake_odoo
+
+
+def test_expand_records_reads_each_related_model_once(orders, make_client):
+    client = make_client()
+    rows = client.search_read("sale.order", [], ["partner_id", "order_line"])
+    orders.calls.clear()
+
+    expanded = client.expand_records(
+        "sale.order",
+        rows,
+        {
+            "partner_id": ["name"],
+            "order_line": {"fields": ["qty"], "expand": {"product_id": ["name"]}},
+        },
+    )
+
+    reads = sorted(model for model, method, *_ in orders.calls if method == "read")
+    assert reads == ["product.product", "res.partner", "sale.order.line"]
+    assert expanded[0]["partner_id"] == {"id": 2, "name": "P2"}
+    assert expanded[3]["partner_id"] is False
+    assert expanded[0]["order_line"] == [
+        {"id": 1, "qty": 1, "product_id": {"id": 2, "name": "Product 2"}},
+        {"id": 2, "qty": 2, "product_id": {"id": 3, "name": "Product 3"}},
+        {"id": 3, "qty": 3, "product_id": {"id": 1, "name": "Product 1"}},
+    ]
+    assert [len(row["order_line"]) for row in expanded] == [3] * 20
+    # The input records are left untouched
+    assert rows[0]["partner_id"] == [2, "P2"]
+
+
+def test_bulk_create_reports_failed_chunks_for_resuming(fake_odoo, make_client):
+    fake_odoo.fail = lambda m, method, args, kw: method == "create" and any(
+        vals["name"] == "P5" for vals in args[0]
+    )
+    client = make_client(cache=OdooCache())
+    assert client.count_records("res.partner", [[]]) == [0]
+    vals_list = [{"name": f"P{i}"} for i in range(1, 9)]
+
+    result = client.bulk_create("res.partner", vals_list, chunk_size=3)
+
+    assert not result["success"]
+    assert len(result["ids"]) == 5
+    assert [(f["chunk"], f["offset"], f["size"]) for f in result["failed"]] == [
+        (1, 3, 3)
+    ]
+    assert "Injected failure in create" in result["failed"][0]["error"]
+    assert result["remaining"] == vals_list[3:6]
+    creates = [call for call in fake_odoo.calls if call[1] == "create"]
+    assert sorted(len(args[0]) for _m, _method, args, _kw in creates) == [2, 3, 3]
+
+    fake_odoo.fail = None
+    resumed = client.bulk_create("res.partner", result["remaining"], chunk_size=3)
+    assert resumed["success"] and resumed["remaining"] == []
+    names = sorted(r["name"] for r in fake_odoo.records["res.partner"].values())
+    assert names == sorted(vals["name"] for vals in vals_list)
+    # Creating evicted the cached count
+    assert client.count_records("res.partner", [[]]) == [8]
+
+
+def test_bulk_write_groups_identical_values(many_partners, make_client):
+    many_partners.fail = lambda m, method, args, kw: method == "write" and 5 in args[0]
+    client = make_client(cache=OdooCache())
+    assert client.read_records("res.partner", [5], ["name"])[0]["name"] == "P5"
+    updates = [{"id": i, "vals": {"name": "Closed"}} for i in range(1, 7)]
+    updates.append({"ids": [7, 8], "vals": {"name": "Open"}})
+
+    result = client.bulk_write("res.partner", updates, chunk_size=4)
+
+    assert not result["success"]
+    assert result["calls"] == 3
+    assert result["updated"] == 6
+    assert [(f["ids"], f["vals"]) for f in result["failed"]] == [
+        ([5, 6], {"name": "Closed"})
+    ]
+    writes = sorted(
+        args[0] for _m, method, args, _kw in many_partners.calls if method == "write"
+    )
+    assert writes == [[1, 2, 3, 4], [5, 6], [7, 8]]
+
+    many_partners.fail = None
+    resumed = client.bulk_write("res.partner", result["failed"])
+    assert resumed == {"success": True, "updated": 2, "calls": 1, "failed": []}
+    records = client.read_records("res.partner", list(range(1, 10)), ["name"])
+    assert [r["name"] for r in records] == ["Closed"] * 6 + ["Open"] * 2 + ["P9"]
+
+
+@pytest.fixture
+def hundred_partners(fake_odoo):
+    fake_odoo.records["res.partner"] = {
+        i: {"id": i, "name": f"P{i}", "active": i % 3 != 0} for i in range(1, 101)
+    }
+    # The first shard answers last
+    fake_odoo.latency = lambda m, method, args, kw: (
+        0.02 if method == "search_read" and ["id", ">=", 1] in args[0] else 0
+    )
+    return fake_odoo
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_scan_merges_id_range_shards(hundred_partners, make_client, ordered):
+    client = make_client()
+    expected = [i for i in range(1, 101) if i % 3]
+
+    records = list(
+        client.scan(
+            "res.partner",
+            [["active", "=", True]],
+            ["name"],
+            shards=4,
+            parallelism=2,
+            ordered=ordered,
+            page_size=10,
+        )
+    )
+
+    ids = [record["id"] for record in records]
+    # Unordered scans yield every record once, in any order
+    assert (ids if ordered else sorted(ids)) == expected
+    ranges = {
+        tuple(term[2] for term in args[0] if term[0] == "id" and term[1] in (">=", "<"))
+        for _m, method, args, _kw in hundred_partners.calls
+        if method == "search_read"
+    }
+    assert ranges == {(1, 26), (26, 51), (51, 76), (76, 101)}
+
+
+def test_counts_and_existence_checks_are_cached(many_partners, make_client):
+    client = make_client(cache=OdooCache())
+    domains = [[], [["name", "=", "P3"]], [["name", "=", "Nobody"]]]
+
+    assert client.count_records("res.partner", domains) == [10, 1, 0]
+    assert client.exists("res.partner", domains) == [True, True, False]
+    searches = [call for call in many_partners.calls if call[1] == "search"]
+    assert len(searches) == 3
+    assert all(kw == {"limit": 1} for *_, kw in searches)
+
+    many_partners.calls.clear()
+    assert client.count_records("res.partner", domains) == [10, 1, 0]
+    assert client.exists("res.partner", domains) == [True, True, False]
+    assert many_partners.calls == []
+
+    client.bulk_write("res.partner", [{"id": 4, "vals": {"name": "Nobody"}}])
+    assert client.count_records("res.partner", domains) == [10, 1, 1]
+    assert client.exists("res.partner", domains) == [True, True, True]
+
+
+def test_failed_counts_are_not_cached(many_partners, make_client):
+    many_partners.fail = lambda m, method, args, kw: args[0] == [["name", "=", "P3"]]
+    client = make_client(cache=OdooCache())
+
+    with pytest.raises(OdooBatchError) as info:
+        client.count_records("res.partner", [[], [["name", "=", "P3"]]])
+    assert info.value.results == [10, None]
+    assert [failure["index"] for failure in info.value.failures] == [1]
+
+    many_partners.fail = None
+    assert client.count_records("res.partner", [[], [["name", "=", "P3"]]]) == [10, 1]
@@ -0,0 +1,137 @@
+import pytest
+
+from odoo_mcp import pagination
+
+NAMES = ["Alpha", "Beta", False, "Beta", "Gamma", False, "Alpha", "Delta"]
+CITIES = ["Paris", False, "Lyon", "Paris"]
+
+
+@pytest.fixture
+def partners(fake_odoo):
+    fake_odoo.fields["res.partner"] = {
+        "name": {"type": "char", "store": True},
+        "city": {"type": "char", "store": True},
+        "email": {"type": "char", "store": True},
+        "parent_id": {"type": "many2one", "store": True},
+    }
+    fake_odoo.records["res.partner"] = {
+        i: {
+            "id": i,
+            "name": NAMES[i % len(NAMES)],
+            "city": CITIES[i % len(CITIES)],
+            "email": f"p{i}@example.com",
+            "parent_id": [i % 3 + 1, f"P{i % 3 + 1}"] if i % 5 else False,
+        }
+        for i in range(1, 41)
+    }
+    return fake_odoo
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    def set_budget(rows=0, size=0):
+        monkeypatch.setenv("ODOO_RESULT_MAX_ROWS", str(rows))
+        monkeypatch.setenv("ODOO_RESULT_MAX_BYTES", str(size))
+
+    return set_budget
+
+
+def read_pages(client, call_tool, domain=None, **kwargs):
+    """Read a search_read and all its continuations, one list per page"""
+    response = call_tool(
+        client,
+        "execute_method",
+        model="res.partner",
+        method="search_read",
+        args=[domain or []],
+        kwargs=kwargs,
+    )
+    pages = []
+    while True:
+        assert response["success"], response
+        pages.append(response["result"])
+        cursor = response.get("next_cursor")
+        if cursor is None:
+            return pages
+        response = call_tool(client, "continue_query", cursor=cursor)
+
+
+def expected_ids(fake_odoo, order, domain=None):
+    records = fake_odoo.execute_kw(
+        "test", 2, "", "res.partner", "search_read", [domain or []], {"order": order}
+    )
+    return [record["id"] for record in records]
+
+
+@pytest.mark.parametrize(
+    "order", ["name desc", "name", "city, name desc", "city desc, name", "id desc"]
+)
+def test_keyset_pages_have_no_gaps_or_duplicates(
+    partners, make_client, call_tool, budget, order
+):
+    budget(rows=3)
+    client = make_client()
+    query = pagination.build_query(client, "res.partner", [[]], {"order": order})
+    assert query["keyset"] is not None
+
+    pages = read_pages(client, call_tool, fields=["email"], order=order)
+
+    ids = [record["id"] for page in pages for record in page]
+    assert ids == expected_ids(partners, f"{order}, id")
+    assert all(len(page) == 3 for page in pages[:-1])
+    # Order fields read for the keyset are not returned
+    assert all(set(record) == {"id", "email"} for page in pages for record in page)
+
+
+def test_keyset_pages_keep_the_domain(partners, make_client, call_tool, budget):
+    budget(rows=4)
+    domain = [["city", "!=", False]]
+    pages = read_pages(make_client(), call_tool, domain, order="name desc")
+
+    ids = [record["id"] for page in pages for record in page]
+    assert ids == expected_ids(partners, "name desc, id", domain)
+
+
+def test_single_oversize_record_is_returned_alone(
+    partners, make_client, call_tool, budget
+):
+    partners.records["res.partner"][2]["email"] = "x" * 5000
+    budget(rows=10, size=2000)
+    pages = read_pages(make_client(), call_tool, fields=["email"], order="id")
+
+    ids = [record["id"] for page in pages for record in page]
+    assert ids == list(range(1, 41))
+    assert [record["id"] for record in pages[1]] == [2]
+    assert all(len(page) > 1 for page in pages[2:-1])
+
+
+def test_explicit_limit_smaller_than_the_budget(
+    partners, make_client, call_tool, budget
+):
+    budget(rows=3)
+    pages = read_pages(make_client(), call_tool, order="name desc", limit=5)
+
+    assert [len(page) for page in pages] == [3, 2]
+    ids = [record["id"] for page in pages for record in page]
+    assert ids == expected_ids(partners, "name desc, id")[:5]
+
+
+def test_offset_fallback_for_orders_without_keyset(
+    partners, make_client, call_tool, budget
+):
+    budget(rows=6)
+    client = make_client()
+    response = call_tool(
+        client,
+        "execute_method",
+        model="res.partner",
+        method="search_read",
+        args=[[]],
+        kwargs={"order": "parent_id desc", "offset": 2},
+    )
+    assert pagination.decode_cursor(response["next_cursor"])["keyset"] is None
+
+    pages = read_pages(client, call_tool, order="parent_id desc", offset=2)
+
+    ids = [record["id"] for page in pages for record in page]
+    assert ids == expected_ids(partners, "parent_id desc, id")[2:]
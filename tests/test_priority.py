@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+
+from odoo_mcp.admission import BULK, INTERACTIVE, NORMAL, Gate, priority
+from odoo_mcp.workers import ToolPool
+
+CLASSES = (BULK, NORMAL, INTERACTIVE)
+
+
+def test_tool_pool_dispatches_by_priority_with_min_shares():
+    pool = ToolPool(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    async def main():
+        blocker = asyncio.ensure_future(pool.run(block))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        tasks = []
+        # Lowest class first, so FIFO dispatch would run bulk first
+        for name in CLASSES:
+            with priority(name):
+                tasks += [
+                    asyncio.ensure_future(pool.run(order.append, name))
+                    for _ in range(10)
+                ]
+        while pool.metrics()["queued"] < 30:
+            await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(blocker, *tasks)
+
+    asyncio.run(main())
+
+    assert order[:5] == [INTERACTIVE] * 5
+    # Passed over five times, normal has earned its 20% share
+    assert order[5] == NORMAL
+    # Bulk gets its 10% share after ten passes
+    assert BULK in order[:12]
+    assert order[-1] != INTERACTIVE
+    assert sorted(order) == sorted([name for name in CLASSES for _ in range(10)])
+
+
+def test_gate_admits_waiting_calls_by_priority_with_min_shares():
+    gate = Gate("res.partner", concurrency=1, max_queue=64)
+    gate.acquire(time.monotonic() + 5)
+    order = []
+
+    def call(name):
+        with priority(name):
+            gate.acquire(time.monotonic() + 5)
+        order.append(name)
+        gate.release()
+
+    threads = [
+        threading.Thread(target=call, args=(name,))
+        for name in CLASSES
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    while gate.waiting < 30:
+        time.sleep(0.01)
+    gate.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert order[:5] == [INTERACTIVE] * 5
+    assert order[5] == NORMAL
+    assert BULK in order[:12]
+    assert len(order) == 30
@@ -0,0 +1,47 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo_mcp.odoo_client import ProxyPool
+
+
+class TrackingProxy:
+    """Wraps a ServerProxy and records calls made while it is already busy"""
+
+    def __init__(self, proxy, overlaps):
+        self._proxy = proxy
+        self._overlaps = overlaps
+        self._busy = threading.Lock()
+
+    def execute_kw(self, *args):
+        if not self._busy.acquire(blocking=False):
+            self._overlaps.append(threading.current_thread().name)
+            return self._proxy.execute_kw(*args)
+        try:
+            return self._proxy.execute_kw(*args)
+        finally:
+            self._busy.release()
+
+    def __call__(self, attr):
+        return self._proxy(attr)
+
+
+def test_concurrent_calls_never_share_a_proxy(fake_odoo, make_client):
+    fake_odoo.records["res.partner"] = {i: {"id": i} for i in range(1, 51)}
+    fake_odoo.latency = lambda *_: 0.002
+    client = make_client()
+    overlaps = []
+    factory = client.proxy_pool._factory
+    client.proxy_pool = ProxyPool(lambda: TrackingProxy(factory(), overlaps))
+
+    def call(index):
+        return client.execute_method("res.partner", "search_count", [["id", ">", 0]])
+
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        results = list(executor.map(call, range(600)))
+
+    assert results == [50] * 600
+    assert overlaps == []
+    assert fake_odoo.max_inflight > 1
+    stats = client.proxy_pool.snapshot()
+    assert stats["in_use"] == 0
+    assert stats["created"] <= 64
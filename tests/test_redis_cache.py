@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+redis = pytest.importorskip("redis")
+
+from odoo_mcp.cache import OdooCache, RedisBackend  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def backend(server, monkeypatch):
+    monkeypatch.setattr(
+        redis.Redis,
+        "from_url",
+        classmethod(lambda cls, url: fakeredis.FakeRedis(server=server)),
+    )
+    return RedisBackend("redis://fake", scope="test")
+
+
+def test_entries_expire_individually(backend):
+    backend.set_many([("query:res.partner", "short", 1)], ttl=0.05)
+    backend.set_many([("query:res.partner", "long", 2)], ttl=300)
+    time.sleep(0.1)
+
+    assert backend.get_many(
+        [("query:res.partner", "short"), ("query:res.partner", "long")]
+    ) == [None, 2]
+    # The expired entry is removed; the hash lives as long as its longest entry
+    key = backend.prefix + "query:res.partner"
+    assert backend._redis.hkeys(key) == [b"long"]
+    assert backend._redis.ttl(key) > 200
+
+
+def test_replicas_share_entries(backend, server):
+    other = RedisBackend("redis://fake", scope="test")
+    backend.set("record:res.partner:1", "k", {"id": 1}, ttl=60)
+
+    assert other.get("record:res.partner:1", "k") == {"id": 1}
+
+
+def test_invalidation_and_clear_data_keep_schema(backend):
+    cache = OdooCache(backend=backend)
+    cache.set_fields("res.partner", {"name": {}})
+    cache.set_records("res.partner", [{"id": 1}, {"id": 2}], "k")
+    cache.set_query("res.partner", "count", 2)
+    cache.set_records("res.users", [{"id": 1}], "k")
+
+    cache.invalidate_model("res.partner")
+
+    assert cache.get_records("res.partner", [1, 2], "k") == ({}, [1, 2])
+    assert cache.get_query("res.partner", "count") is None
+    assert cache.get_records("res.users", [1], "k")[0] == {1: {"id": 1}}
+    assert not backend._redis.exists(backend._index("record:res.partner:"))
+
+    cache.clear_data()
+
+    assert cache.get_records("res.users", [1], "k") == ({}, [1])
+    assert cache.get_fields("res.partner") == {"name": {}}
+    # Only the schema hash and its index are left
+    assert all(b"schema:" in key for key in backend._redis.keys())
+
+
+def test_schema_entries_expire(backend):
+    cache = OdooCache(backend=backend, schema_ttl=600)
+    cache.set_fields("res.partner", {"name": {}})
+
+    assert 0 < backend._redis.ttl(backend.prefix + "schema:res.partner") <= 600
+
+
+def test_set_many_is_one_round_trip(backend, monkeypatch):
+    executed = []
+    direct = []
+    pipeline = backend._redis.pipeline
+
+    def counting_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        execute = pipe.execute
+        pipe.execute = lambda *a, **kw: executed.append(len(pipe)) or execute(*a, **kw)
+        return pipe
+
+    execute_command = backend._redis.execute_command
+    monkeypatch.setattr(backend._redis, "pipeline", counting_pipeline)
+    monkeypatch.setattr(
+        backend._redis,
+        "execute_command",
+        lambda *a, **kw: direct.append(a[0]) or execute_command(*a, **kw),
+    )
+
+    cache = OdooCache(backend=backend)
+    cache.set_records("res.partner", [{"id": i} for i in range(1, 101)], "k")
+
+    assert len(executed) == 1 and executed[0] > 100
+    assert direct == []
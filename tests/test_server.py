@@ -0,0 +1,176 @@
+import pytest
+
+from odoo_mcp.cache import OdooCache
+
+
+@pytest.fixture
+def partners(fake_odoo):
+    fake_odoo.records["res.partner"] = {
+        1: {"id": 1, "name": "Alice"},
+        2: {"id": 2, "name": "Bob"},
+    }
+    return fake_odoo
+
+
+def test_write_through_execute_method_evicts_cached_records(
+    partners, make_client, call_tool
+):
+    client = make_client(cache=OdooCache())
+    assert client.read_records("res.partner", [1], ["name"])[0]["name"] == "Alice"
+    assert client.count_records("res.partner", [[]]) == [2]
+
+    response = call_tool(
+        client,
+        "execute_method",
+        model="res.partner",
+        method="write",
+        args=[[1], {"name": "Alicia"}],
+    )
+    assert response["success"]
+    call_tool(
+        client,
+        "execute_method",
+        model="res.partner",
+        method="create",
+        args=[{"name": "Carol"}],
+    )
+
+    assert client.read_records("res.partner", [1], ["name"])[0]["name"] == "Alicia"
+    assert client.count_records("res.partner", [[]]) == [3]
+
+
+def test_batch_execute_evicts_cached_records(partners, make_client, call_tool):
+    client = make_client(cache=OdooCache())
+    client.read_records("res.partner", [2], ["name"])
+
+    response = call_tool(
+        client,
+        "batch_execute",
+        operations=[
+            {"model": "res.partner", "method": "write", "args": [[2], {"name": "Rob"}]}
+        ],
+    )
+
+    assert response["success"]
+    assert client.read_records("res.partner", [2], ["name"])[0]["name"] == "Rob"
+
+
+def test_batch_execute_resolves_references(partners, make_client, call_tool):
+    client = make_client()
+
+    response = call_tool(
+        client,
+        "batch_execute",
+        operations=[
+            {"model": "res.partner", "method": "create", "args": [{"name": "Co"}]},
+            {
+                "model": "res.partner",
+                "method": "create",
+                "args": [{"name": "Dan", "parent_id": {"$ref": 0}}],
+            },
+            {
+                "model": "res.partner",
+                "method": "read",
+                "args": [[{"$ref": 1}]],
+                "kwargs": {"fields": ["parent_id"]},
+            },
+        ],
+    )
+
+    assert response["success"]
+    company, contact = (
+        response["results"][0]["result"],
+        response["results"][1]["result"],
+    )
+    assert response["results"][2]["result"] == [{"id": contact, "parent_id": company}]
+
+
+def test_batch_execute_propagates_failures(partners, make_client, call_tool):
+    partners.fail = lambda m, method, args, kw: method == "create"
+    client = make_client()
+
+    response = call_tool(
+        client,
+        "batch_execute",
+        operations=[
+            {"model": "res.partner", "method": "create", "args": [{"name": "Co"}]},
+            {
+                "model": "res.partner",
+                "method": "write",
+                "args": [[1], {"parent_id": {"$ref": 0}}],
+            },
+            {"model": "res.partner", "method": "search_count", "args": [[]]},
+        ],
+    )
+
+    assert not response["success"]
+    first, dependent, independent = response["results"]
+    assert not first["success"] and "Injected failure" in first["error"]
+    assert dependent == {
+        "success": False,
+        "error": "Referenced operations failed: [0]",
+    }
+    assert independent == {"success": True, "result": 2}
+    # The dependent write was never sent
+    assert sorted(call[1] for call in partners.calls) == ["create", "search_count"]
+
+
+def test_batch_execute_rejects_forward_references(partners, make_client, call_tool):
+    response = call_tool(
+        make_client(),
+        "batch_execute",
+        operations=[
+            {"model": "res.partner", "method": "read", "args": [[{"$ref": 1}]]},
+            {"model": "res.partner", "method": "search", "args": [[]]},
+        ],
+    )
+
+    assert not response["success"]
+    assert "references invalid operations: [1]" in response["error"]
+    assert response["results"] == []
+
+
+def test_batch_execute_concurrency_is_capped(partners, make_client, call_tool):
+    partners.latency = lambda *_: 0.05
+    client = make_client(max_workers=2)
+
+    response = call_tool(
+        client,
+        "batch_execute",
+        operations=[{"model": "res.partner", "method": "search", "args": [[]]}] * 8,
+        max_concurrency=500,
+    )
+
+    assert response["success"]
+    assert partners.max_inflight == 2
+
+
+def test_aggregate_records_groups_in_one_call(fake_odoo, make_client, call_tool):
+    fake_odoo.records["sale.order"] = {
+        i: {
+            "id": i,
+            "partner_id": [i % 3 + 1, f"P{i % 3 + 1}"],
+            "state": "cancel" if i == 9 else "sale",
+            "amount_total": 10.0 * i,
+        }
+        for i in range(1, 10)
+    }
+
+    response = call_tool(
+        make_client(),
+        "aggregate_records",
+        model="sale.order",
+        groupby=["partner_id"],
+        aggregates=["amount_total:sum", "biggest:max(amount_total)"],
+        domain=[["state", "=", "sale"]],
+        orderby="amount_total desc",
+        limit=2,
+    )
+
+    assert response["success"]
+    assert response["result"] == [
+        {"partner_id": [3, "P3"], "count": 3, "amount_total": 150.0, "biggest": 80.0},
+        {"partner_id": [2, "P2"], "count": 3, "amount_total": 120.0, "biggest": 70.0},
+    ]
+    (call,) = [call for call in fake_odoo.calls if call[1] == "read_group"]
+    assert call[3] == {"lazy": False, "limit": 2, "orderby": "amount_total desc"}